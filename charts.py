@@ -3,104 +3,471 @@ Data visualization components for YouTube statistics
 Creates interactive charts using matplotlib and plotly
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.dates as mdates
-from matplotlib.figure import Figure
-import plotly.graph_objects as go
-import plotly.express as px
-from plotly.subplots import make_subplots
-import pandas as pd
+import copy
+import functools
+import hashlib
+import pickle
+import threading
+from collections import OrderedDict
 from datetime import datetime
-from typing import List, Dict, Optional
+from string import Template
+from typing import List, Dict, Optional, TYPE_CHECKING
 import numpy as np
 
-from config import CHART_COLORS
+# matplotlib and plotly are imported on first use to keep the
+# import of this module cheap for code paths that never draw a chart
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    import plotly.graph_objects as go
+
+from config import (CHART_COLORS, CHART_FILL_COLORS, PLOTLY_MAX_POINTS, PLOTLY_LARGE_SERIES_POINTS,
+                    FIGURE_CACHE_SIZE, CHART_SAVE_DPI)
+
+
+def _data_digest(*data) -> bytes:
+    """Digest of chart input data, used as figure cache key"""
+    return hashlib.blake2b(pickle.dumps(data), digest_size=16).digest()
+
+
+_NUMBER_BINS = np.array([1e3, 1e6, 1e9])
+_NUMBER_DIVISORS = np.array([1, 1e3, 1e6, 1e9])
+_NUMBER_SUFFIXES = np.array(['', 'K', 'M', 'B'])
+
+
+def format_numbers(values) -> np.ndarray:
+    """
+    Format numbers with K/M/B suffixes
+    
+    Args:
+        values: Number or array-like of numbers
+        
+    Returns:
+        Array of formatted strings with the same shape as values
+    """
+    arr = np.asarray(values, dtype=np.float64)
+    idx = np.searchsorted(_NUMBER_BINS, arr, side='right')
+    scaled = np.char.add(np.char.mod('%.1f', arr / _NUMBER_DIVISORS[idx]),
+                         _NUMBER_SUFFIXES[idx])
+    return np.where(idx == 0, np.char.mod('%d', arr), scaled)
+
+
+# Guards the LRU caches, the chart instance is shared by all Streamlit sessions
+_CACHE_LOCK = threading.Lock()
+
+
+def _lru_get(cache: OrderedDict, key, build):
+    """Get a value from an LRU cache dict, building and storing it on a miss"""
+    with _CACHE_LOCK:
+        value = cache.get(key)
+        if value is not None:
+            cache.move_to_end(key)
+            return value
+    
+    # Build outside the lock; two threads missing at once both build, last one wins
+    value = build()
+    with _CACHE_LOCK:
+        cache[key] = value
+        cache.move_to_end(key)
+        if len(cache) > FIGURE_CACHE_SIZE:
+            cache.popitem(last=False)
+    return value
+
+
+def _first_match(mask: np.ndarray, starts: np.ndarray) -> np.ndarray:
+    """Index of the first True in mask at or after each bucket start"""
+    candidates = np.flatnonzero(mask)
+    return candidates[np.searchsorted(candidates, starts)]
+
+
+def _bucket_extrema(y: np.ndarray, starts: np.ndarray):
+    """
+    Indices of the minimum and maximum of each contiguous bucket
+    
+    Args:
+        y: Values
+        starts: Sorted start index of each (non-empty) bucket
+        
+    Returns:
+        Tuple of (argmin indices, argmax indices)
+    """
+    counts = np.diff(np.append(starts, len(y)))
+    mins = np.repeat(np.minimum.reduceat(y, starts), counts)
+    maxs = np.repeat(np.maximum.reduceat(y, starts), counts)
+    return _first_match(y == mins, starts), _first_match(y == maxs, starts)
+
+
+def _minmax_downsample(x: np.ndarray, y: np.ndarray, n_out: int):
+    """
+    Reduce a series to roughly n_out points keeping each bucket's min and max
+    
+    Args:
+        x: X values (dates)
+        y: Y values
+        n_out: Target number of points
+        
+    Returns:
+        Tuple of downsampled (x, y)
+    """
+    n = len(y)
+    if n <= n_out:
+        return x, y
+    
+    starts = np.linspace(0, n, n_out // 2, endpoint=False).astype(np.int64)
+    argmin, argmax = _bucket_extrema(y, starts)
+    
+    idx = np.unique(np.concatenate(([0, n - 1], argmin, argmax)))
+    return x[idx], y[idx]
+
+
+def _m4_downsample(x: np.ndarray, y: np.ndarray, n_pixels: int):
+    """
+    M4 aggregation: keep first, last, min and max point per pixel column
+    
+    Drawing the aggregate gives the same line as drawing every point, as
+    long as n_pixels matches the rendered plot width.
+    
+    Args:
+        x: Sorted x values (dates)
+        y: Y values
+        n_pixels: Number of horizontal pixel columns
+        
+    Returns:
+        Tuple of downsampled (x, y)
+    """
+    if len(y) <= 4 * n_pixels:
+        return x, y
+    
+    idx = _m4_indices(x.astype(np.int64), y, n_pixels)
+    return x[idx], y[idx]
+
+
+def _m4_indices(x: np.ndarray, y: np.ndarray, n_buckets: int) -> np.ndarray:
+    """
+    Sorted, unique indices of the M4 points of a series
+    
+    Bucket boundaries are found with a binary search of the bucket edges
+    in the sorted x values, so no per-point bucket ids are computed.
+    
+    Args:
+        x: Sorted int64 x values
+        y: Y values
+        n_buckets: Number of equal-width x buckets
+        
+    Returns:
+        int64 index array with at most 4 * n_buckets entries
+    """
+    edges = np.linspace(x[0], x[-1], n_buckets + 1)[:-1]
+    starts = np.unique(np.searchsorted(x, edges, side='left'))
+    ends = np.append(starts[1:], len(x)) - 1
+    argmin, argmax = _bucket_extrema(y, starts)
+    
+    return np.unique(np.concatenate((starts, ends, argmin, argmax)))
+
+
+def _has_data(data) -> bool:
+    """Whether a history (list of points or DataFrame) has any points"""
+    return data is not None and len(data) > 0
+
+
+# Parsed history series keyed by (id(data), len(data), column). Entries keep a
+# reference to the source data so its id cannot be reused while cached.
+_SERIES_CACHE = OrderedDict()
+
+
+def _prepare_series(data: List[Dict], y_col: str):
+    """
+    Convert history data points to date and value arrays
+    
+    The result is memoized per history object, so a history passed to
+    several chart builders is only parsed once.
+    
+    Args:
+        data: List of data points, or a DataFrame indexed by date
+        y_col: Name of the metric key or column
+        
+    Returns:
+        Tuple of (datetime64[ns] dates, int64 values)
+    """
+    def build():
+        if hasattr(data, 'columns'):
+            # Columnar history, no per-point conversion needed
+            return (data, data.index.to_numpy(dtype='datetime64[ns]'),
+                    data[y_col].to_numpy(dtype=np.int64))
+        
+        n = len(data)
+        dates = np.fromiter((point['date'] for point in data), dtype='datetime64[ns]', count=n)
+        values = np.fromiter((point[y_col] for point in data), dtype=np.int64, count=n)
+        return data, dates, values
+    
+    _, dates, values = _lru_get(_SERIES_CACHE, (id(data), len(data), y_col), build)
+    return dates, values
+
+
+def _plotly_series(dates: np.ndarray, values: np.ndarray):
+    """
+    Get (x, y) arrays for a plotly trace, downsampled for long histories
+    
+    Dates are returned as epoch milliseconds, which plotly serializes as a
+    plain number array instead of one date string per point. The target
+    x-axis must be of type 'date'.
+    """
+    x = dates.astype('datetime64[ms]').astype(np.int64)
+    return _minmax_downsample(x, values, PLOTLY_MAX_POINTS)
+
+
+_SUMMARY_TMPL = Template(
+    "📊 KANAL-STATISTIKEN\n"
+    + "=" * 50 + "\n"
+    "\n"
+    "📺 Kanal: $title\n"
+    "🔗 URL: https://youtube.com/@$custom_url\n"
+    "\n"
+    "📈 Abonnenten: $subscribers\n"
+    "👀 Aufrufe:    $views\n"
+    "🎥 Videos:     $videos\n"
+    "\n"
+    "📅 Erstellt: $published\n"
+    "\n"
+    "📝 Beschreibung:\n"
+    "$description"
+)
+
+
+@functools.lru_cache(maxsize=1024)
+def _format_published(date_str: str) -> str:
+    """Format an ISO 8601 API timestamp as DD.MM.YYYY"""
+    return datetime.fromisoformat(date_str.replace('Z', '+00:00')).strftime('%d.%m.%Y')
+
+
+def _is_large_series(data) -> bool:
+    """Whether a series is long enough to drop markers, fill and unified hover"""
+    return data is not None and len(data) > PLOTLY_LARGE_SERIES_POINTS
+
+
+def _combined_mode(data) -> Optional[str]:
+    """Trace mode for a combined-chart series (None keeps the plotly default)"""
+    return 'lines' if _is_large_series(data) else None
 
 
 class YouTubeCharts:
     """Class for creating YouTube statistics charts"""
     
+    # Shared y-axis formatter for the matplotlib charts (created with the style)
+    _COMMA_FMT = None
+    
     def __init__(self):
         """Initialize chart settings"""
-        plt.style.use('dark_background')
         self.colors = CHART_COLORS
+        self._styled = False
+        
+        # Matplotlib figure/axes reused across charts (created lazily)
+        self._mpl_fig = None
+        self._mpl_ax = None
+        
+        # Plotly figures and their JSON keyed by (chart type, data digest, channel name)
+        self._figure_cache = OrderedDict()
+        self._json_cache = OrderedDict()
+        
+        self._combined_template = None
     
-    def create_subscriber_chart(self, data: List[Dict], channel_name: str, 
-                              use_plotly: bool = True) -> Optional[Figure]:
+    def _cached_figure(self, key: tuple, build) -> 'go.Figure':
         """
-        Create subscriber growth chart
+        Get a plotly figure from the LRU cache, building it on a miss
+        
+        Cached figures are shared between callers and must not be mutated.
         
         Args:
-            data: List of subscriber data points
-            channel_name: Name of the channel
-            use_plotly: Whether to use plotly (True) or matplotlib (False)
+            key: Cache key
+            build: Callable creating the figure
             
         Returns:
             Chart figure
         """
-        if not data:
+        return _lru_get(self._figure_cache, key, build)
+    
+    def _cached_json(self, create, chart_type: str, data: List[Dict],
+                     channel_name: str) -> Optional[str]:
+        """
+        Get the serialized JSON of a plotly chart, cached by input digest
+        
+        Args:
+            create: Chart creation method
+            chart_type: Chart type used in the cache key
+            data: List of data points
+            channel_name: Name of the channel
+            
+        Returns:
+            Plotly figure JSON string
+        """
+        import plotly.io as pio
+        
+        if not _has_data(data):
             return None
         
-        df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
+        key = (chart_type, _data_digest(data), channel_name)
+        return _lru_get(self._json_cache, key,
+                        lambda: pio.to_json(create(data, channel_name), validate=False, pretty=False))
+    
+    def _ensure_style(self):
+        """Apply the matplotlib style on first use"""
+        if self._styled:
+            return
+        
+        import matplotlib.pyplot as plt
+        from matplotlib.ticker import FuncFormatter
         
-        if use_plotly:
-            fig = go.Figure()
+        plt.style.use('dark_background')
+        if YouTubeCharts._COMMA_FMT is None:
+            YouTubeCharts._COMMA_FMT = FuncFormatter(lambda x, p: f'{x:,.0f}')
+        self._styled = True
+    
+    def _get_mpl_axes(self):
+        """
+        Get the shared matplotlib figure and axes, cleared for a new chart
+        
+        Returns:
+            Tuple of (figure, axes)
+        """
+        if self._mpl_fig is None:
+            import matplotlib.pyplot as plt
             
-            fig.add_trace(go.Scatter(
-                x=df['date'],
-                y=df['subscribers'],
-                mode='lines+markers',
-                name='Abonnenten',
-                line=dict(color=self.colors['subscribers'], width=3),
-                marker=dict(size=8, color=self.colors['subscribers']),
-                fill='tonexty',
-                fillcolor=f"rgba(255, 0, 0, 0.1)"
-            ))
+            self._ensure_style()
+            self._mpl_fig, self._mpl_ax = plt.subplots(figsize=(12, 6))
+        else:
+            self._mpl_ax.cla()
+        return self._mpl_fig, self._mpl_ax
+    
+    def _render_line_chart(self, fig: 'Figure', ax, dates: np.ndarray, values: np.ndarray,
+                           color: str, title: str, ylabel: str) -> 'Figure':
+        """
+        Draw a single-metric line chart onto prebuilt matplotlib axes
+        
+        Args:
+            fig: Target figure
+            ax: Target axes (already cleared)
+            dates: Date array
+            values: Metric values
+            color: Line and fill color
+            title: Chart title
+            ylabel: Y-axis label
+            
+        Returns:
+            Chart figure
+        """
+        # Size the aggregation for the highest resolution the chart is saved at
+        n_pixels = int(fig.get_size_inches()[0] * CHART_SAVE_DPI)
+        dates, values = _m4_downsample(dates, values, n_pixels)
+        
+        ax.plot(dates, values, 
+               color=color, linewidth=3, marker='o', markersize=6)
+        ax.fill_between(dates, values, alpha=0.3, color=color)
+        
+        ax.set_title(title, fontsize=16, color='white', fontweight='bold')
+        ax.set_xlabel('Datum', color='white')
+        ax.set_ylabel(ylabel, color='white')
+        ax.tick_params(colors='white')
+        ax.grid(True, alpha=0.3, color=self.colors['grid'])
+        
+        # Format y-axis with commas
+        ax.yaxis.set_major_formatter(self._COMMA_FMT)
+        
+        fig.tight_layout()
+        return fig
+    
+    def _render_plotly_line_chart(self, dates: np.ndarray, values: np.ndarray, y_col: str,
+                                  name: str, title: str) -> 'go.Figure':
+        """
+        Build a single-metric plotly line chart
+        
+        Args:
+            dates: Date array
+            values: Metric values
+            y_col: Name of the metric (selects the color)
+            name: Trace name and y-axis title
+            title: Chart title
             
-            fig.update_layout(
-                title=f'Abonnentenentwicklung - {channel_name}',
-                xaxis_title='Datum',
-                yaxis_title='Abonnenten',
-                plot_bgcolor=self.colors['background'],
-                paper_bgcolor=self.colors['background'],
-                font=dict(color='white'),
-                xaxis=dict(
-                    gridcolor=self.colors['grid'],
-                    showgrid=True
-                ),
-                yaxis=dict(
-                    gridcolor=self.colors['grid'],
-                    showgrid=True,
-                    tickformat=','
-                ),
-                hovermode='x unified'
+        Returns:
+            Chart figure
+        """
+        import plotly.graph_objects as go
+        
+        x, y = _plotly_series(dates, values)
+        
+        # Markers, area fill and unified hover get expensive on long series
+        if _is_large_series(values):
+            style = dict(mode='lines')
+            hover = dict(hovermode='x', spikedistance=-1)
+        else:
+            style = dict(
+                mode='lines+markers',
+                marker=dict(size=8, color=self.colors[y_col]),
+                fill='tozeroy',
+                fillcolor=CHART_FILL_COLORS[y_col]
             )
+            hover = dict(hovermode='x unified')
+        
+        fig = go.Figure()
+        
+        fig.add_trace(go.Scattergl(
+            x=x,
+            y=y,
+            name=name,
+            line=dict(color=self.colors[y_col], width=3),
+            **style
+        ))
+        
+        fig.update_layout(
+            title=title,
+            xaxis_title='Datum',
+            yaxis_title=name,
+            plot_bgcolor=self.colors['background'],
+            paper_bgcolor=self.colors['background'],
+            font=dict(color='white'),
+            xaxis=dict(
+                type='date',
+                gridcolor=self.colors['grid'],
+                showgrid=True
+            ),
+            yaxis=dict(
+                gridcolor=self.colors['grid'],
+                showgrid=True,
+                tickformat=','
+            ),
+            **hover
+        )
+        
+        return fig
+    
+    def create_subscriber_chart(self, data: List[Dict], channel_name: str, 
+                              use_plotly: bool = True) -> Optional['Figure']:
+        """
+        Create subscriber growth chart
+        
+        Args:
+            data: List of subscriber data points
+            channel_name: Name of the channel
+            use_plotly: Whether to use plotly (True) or matplotlib (False)
             
-            return fig
+        Returns:
+            Chart figure. A matplotlib figure (use_plotly=False) is reused by
+            the next matplotlib chart call; save or copy it first.
+        """
+        if not _has_data(data):
+            return None
+        
+        if use_plotly:
+            key = ('subscribers', _data_digest(data), channel_name)
+            return self._cached_figure(key, lambda: self._render_plotly_line_chart(
+                *_prepare_series(data, 'subscribers'), 'subscribers', 'Abonnenten',
+                f'Abonnentenentwicklung - {channel_name}'))
         else:
             # Matplotlib version
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(df['date'], df['subscribers'], 
-                   color=self.colors['subscribers'], linewidth=3, marker='o', markersize=6)
-            ax.fill_between(df['date'], df['subscribers'], alpha=0.3, 
-                          color=self.colors['subscribers'])
-            
-            ax.set_title(f'Abonnentenentwicklung - {channel_name}', 
-                        fontsize=16, color='white', fontweight='bold')
-            ax.set_xlabel('Datum', color='white')
-            ax.set_ylabel('Abonnenten', color='white')
-            ax.tick_params(colors='white')
-            ax.grid(True, alpha=0.3, color=self.colors['grid'])
-            
-            # Format y-axis with commas
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
-            
-            plt.tight_layout()
-            return fig
+            fig, ax = self._get_mpl_axes()
+            return self._render_line_chart(fig, ax, *_prepare_series(data, 'subscribers'), self.colors['subscribers'],
+                                           f'Abonnentenentwicklung - {channel_name}', 'Abonnenten')
     
     def create_view_chart(self, data: List[Dict], channel_name: str, 
-                         use_plotly: bool = True) -> Optional[Figure]:
+                         use_plotly: bool = True) -> Optional['Figure']:
         """
         Create view count chart
         
@@ -110,71 +477,25 @@ class YouTubeCharts:
             use_plotly: Whether to use plotly (True) or matplotlib (False)
             
         Returns:
-            Chart figure
+            Chart figure. A matplotlib figure (use_plotly=False) is reused by
+            the next matplotlib chart call; save or copy it first.
         """
-        if not data:
+        if not _has_data(data):
             return None
         
-        df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
-        
         if use_plotly:
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=df['date'],
-                y=df['views'],
-                mode='lines+markers',
-                name='Aufrufe',
-                line=dict(color=self.colors['views'], width=3),
-                marker=dict(size=8, color=self.colors['views']),
-                fill='tonexty',
-                fillcolor=f"rgba(0, 212, 170, 0.1)"
-            ))
-            
-            fig.update_layout(
-                title=f'Aufrufentwicklung - {channel_name}',
-                xaxis_title='Datum',
-                yaxis_title='Aufrufe',
-                plot_bgcolor=self.colors['background'],
-                paper_bgcolor=self.colors['background'],
-                font=dict(color='white'),
-                xaxis=dict(
-                    gridcolor=self.colors['grid'],
-                    showgrid=True
-                ),
-                yaxis=dict(
-                    gridcolor=self.colors['grid'],
-                    showgrid=True,
-                    tickformat=','
-                ),
-                hovermode='x unified'
-            )
-            
-            return fig
+            key = ('views', _data_digest(data), channel_name)
+            return self._cached_figure(key, lambda: self._render_plotly_line_chart(
+                *_prepare_series(data, 'views'), 'views', 'Aufrufe',
+                f'Aufrufentwicklung - {channel_name}'))
         else:
             # Matplotlib version
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(df['date'], df['views'], 
-                   color=self.colors['views'], linewidth=3, marker='o', markersize=6)
-            ax.fill_between(df['date'], df['views'], alpha=0.3, 
-                          color=self.colors['views'])
-            
-            ax.set_title(f'Aufrufentwicklung - {channel_name}', 
-                        fontsize=16, color='white', fontweight='bold')
-            ax.set_xlabel('Datum', color='white')
-            ax.set_ylabel('Aufrufe', color='white')
-            ax.tick_params(colors='white')
-            ax.grid(True, alpha=0.3, color=self.colors['grid'])
-            
-            # Format y-axis with commas
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
-            
-            plt.tight_layout()
-            return fig
+            fig, ax = self._get_mpl_axes()
+            return self._render_line_chart(fig, ax, *_prepare_series(data, 'views'), self.colors['views'],
+                                           f'Aufrufentwicklung - {channel_name}', 'Aufrufe')
     
     def create_video_chart(self, data: List[Dict], channel_name: str, 
-                          use_plotly: bool = True) -> Optional[Figure]:
+                          use_plotly: bool = True) -> Optional['Figure']:
         """
         Create video count chart
         
@@ -184,72 +505,65 @@ class YouTubeCharts:
             use_plotly: Whether to use plotly (True) or matplotlib (False)
             
         Returns:
-            Chart figure
+            Chart figure. A matplotlib figure (use_plotly=False) is reused by
+            the next matplotlib chart call; save or copy it first.
         """
-        if not data:
+        if not _has_data(data):
             return None
         
-        df = pd.DataFrame(data)
-        df['date'] = pd.to_datetime(df['date'])
-        
         if use_plotly:
-            fig = go.Figure()
-            
-            fig.add_trace(go.Scatter(
-                x=df['date'],
-                y=df['videos'],
-                mode='lines+markers',
-                name='Videos',
-                line=dict(color=self.colors['videos'], width=3),
-                marker=dict(size=8, color=self.colors['videos']),
-                fill='tonexty',
-                fillcolor=f"rgba(255, 107, 53, 0.1)"
-            ))
-            
-            fig.update_layout(
-                title=f'Video-Entwicklung - {channel_name}',
-                xaxis_title='Datum',
-                yaxis_title='Videos',
-                plot_bgcolor=self.colors['background'],
-                paper_bgcolor=self.colors['background'],
-                font=dict(color='white'),
-                xaxis=dict(
-                    gridcolor=self.colors['grid'],
-                    showgrid=True
-                ),
-                yaxis=dict(
-                    gridcolor=self.colors['grid'],
-                    showgrid=True,
-                    tickformat=','
-                ),
-                hovermode='x unified'
-            )
-            
-            return fig
+            key = ('videos', _data_digest(data), channel_name)
+            return self._cached_figure(key, lambda: self._render_plotly_line_chart(
+                *_prepare_series(data, 'videos'), 'videos', 'Videos',
+                f'Video-Entwicklung - {channel_name}'))
         else:
             # Matplotlib version
-            fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(df['date'], df['videos'], 
-                   color=self.colors['videos'], linewidth=3, marker='o', markersize=6)
-            ax.fill_between(df['date'], df['videos'], alpha=0.3, 
-                          color=self.colors['videos'])
+            fig, ax = self._get_mpl_axes()
+            return self._render_line_chart(fig, ax, *_prepare_series(data, 'videos'), self.colors['videos'],
+                                           f'Video-Entwicklung - {channel_name}', 'Videos')
+    
+    def create_subscriber_chart_json(self, data: List[Dict], channel_name: str) -> Optional[str]:
+        """
+        Create subscriber growth chart as pre-serialized plotly JSON
+        
+        Args:
+            data: List of subscriber data points
+            channel_name: Name of the channel
             
-            ax.set_title(f'Video-Entwicklung - {channel_name}', 
-                        fontsize=16, color='white', fontweight='bold')
-            ax.set_xlabel('Datum', color='white')
-            ax.set_ylabel('Videos', color='white')
-            ax.tick_params(colors='white')
-            ax.grid(True, alpha=0.3, color=self.colors['grid'])
+        Returns:
+            Plotly figure JSON string
+        """
+        return self._cached_json(self.create_subscriber_chart, 'subscribers', data, channel_name)
+    
+    def create_view_chart_json(self, data: List[Dict], channel_name: str) -> Optional[str]:
+        """
+        Create view count chart as pre-serialized plotly JSON
+        
+        Args:
+            data: List of view data points
+            channel_name: Name of the channel
             
-            # Format y-axis with commas
-            ax.yaxis.set_major_formatter(plt.FuncFormatter(lambda x, p: f'{x:,.0f}'))
+        Returns:
+            Plotly figure JSON string
+        """
+        return self._cached_json(self.create_view_chart, 'views', data, channel_name)
+    
+    def create_video_chart_json(self, data: List[Dict], channel_name: str) -> Optional[str]:
+        """
+        Create video count chart as pre-serialized plotly JSON
+        
+        Args:
+            data: List of video data points
+            channel_name: Name of the channel
             
-            plt.tight_layout()
-            return fig
+        Returns:
+            Plotly figure JSON string
+        """
+        return self._cached_json(self.create_video_chart, 'videos', data, channel_name)
     
     def create_combined_chart(self, subscriber_data: List[Dict], 
                             view_data: List[Dict], video_data: List[Dict], 
-                            channel_name: str) -> Figure:
+                            channel_name: str, channel_id: str = '') -> 'go.Figure':
         """
         Create a combined chart with all three metrics
         
@@ -258,48 +572,113 @@ class YouTubeCharts:
             view_data: View data points
             video_data: Video data points
             channel_name: Name of the channel
+            channel_id: ID of the channel, channel names are not unique
             
         Returns:
-            Combined chart figure
+            Combined chart figure, a copy owned by the caller that may be
+            updated in place with update_combined_chart
         """
-        fig = make_subplots(
-            rows=3, cols=1,
-            subplot_titles=('Abonnenten', 'Aufrufe', 'Videos'),
-            vertical_spacing=0.1
+        import plotly.graph_objects as go
+        
+        key = ('combined', channel_id, _data_digest(subscriber_data, view_data, video_data), channel_name)
+        fig = self._cached_figure(key, lambda: self._build_combined_chart(
+            subscriber_data, view_data, video_data, channel_name))
+        return go.Figure(fig)
+    
+    def update_combined_chart(self, fig: 'go.Figure', subscriber_data: List[Dict],
+                              view_data: List[Dict], video_data: List[Dict]) -> 'go.Figure':
+        """
+        Replace the trace data of a combined chart in place
+        
+        Only the x/y arrays are swapped inside a single batch update, so a
+        FigureWidget showing the chart re-renders incrementally instead of
+        being rebuilt.
+        
+        Args:
+            fig: Figure created by create_combined_chart
+            subscriber_data: Subscriber data points
+            view_data: View data points
+            video_data: Video data points
+            
+        Returns:
+            The updated figure
+        """
+        series = (
+            (subscriber_data, 'subscribers'),
+            (view_data, 'views'),
+            (video_data, 'videos'),
         )
+        with fig.batch_update():
+            for trace, (data, y_col) in zip(fig.data, series):
+                trace.x, trace.y = self._combined_series(data, y_col)
+                trace.mode = _combined_mode(data)
+        return fig
+    
+    @staticmethod
+    def _combined_series(data: List[Dict], y_col: str):
+        """Get (x, y) arrays for one combined-chart trace, empty if there is no data"""
+        if not _has_data(data):
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return _plotly_series(*_prepare_series(data, y_col))
+    
+    def _build_combined_chart(self, subscriber_data: List[Dict], 
+                              view_data: List[Dict], video_data: List[Dict], 
+                              channel_name: str) -> 'go.Figure':
+        """
+        Build the combined three-metric plotly figure
+        
+        All three traces are always added (empty when a metric has no data)
+        so update_combined_chart can address them by index.
+        """
+        import plotly.graph_objects as go
+        
+        fig = copy.deepcopy(self._get_combined_template())
+        fig.update_layout(title=f'Kanal-Entwicklung - {channel_name}')
         
         # Subscriber chart
-        if subscriber_data:
-            df_subs = pd.DataFrame(subscriber_data)
-            df_subs['date'] = pd.to_datetime(df_subs['date'])
-            fig.add_trace(
-                go.Scatter(x=df_subs['date'], y=df_subs['subscribers'], 
-                          name='Abonnenten', line=dict(color=self.colors['subscribers'])),
-                row=1, col=1
-            )
+        x, y = self._combined_series(subscriber_data, 'subscribers')
+        fig.add_trace(
+            go.Scattergl(x=x, y=y, mode=_combined_mode(subscriber_data),
+                      name='Abonnenten', line=dict(color=self.colors['subscribers'])),
+            row=1, col=1
+        )
         
         # View chart
-        if view_data:
-            df_views = pd.DataFrame(view_data)
-            df_views['date'] = pd.to_datetime(df_views['date'])
-            fig.add_trace(
-                go.Scatter(x=df_views['date'], y=df_views['views'], 
-                          name='Aufrufe', line=dict(color=self.colors['views'])),
-                row=2, col=1
-            )
+        x, y = self._combined_series(view_data, 'views')
+        fig.add_trace(
+            go.Scattergl(x=x, y=y, mode=_combined_mode(view_data),
+                      name='Aufrufe', line=dict(color=self.colors['views'])),
+            row=2, col=1
+        )
         
         # Video chart
-        if video_data:
-            df_videos = pd.DataFrame(video_data)
-            df_videos['date'] = pd.to_datetime(df_videos['date'])
-            fig.add_trace(
-                go.Scatter(x=df_videos['date'], y=df_videos['videos'], 
-                          name='Videos', line=dict(color=self.colors['videos'])),
-                row=3, col=1
-            )
+        x, y = self._combined_series(video_data, 'videos')
+        fig.add_trace(
+            go.Scattergl(x=x, y=y, mode=_combined_mode(video_data),
+                      name='Videos', line=dict(color=self.colors['videos'])),
+            row=3, col=1
+        )
+        
+        return fig
+    
+    def _get_combined_template(self) -> 'go.Figure':
+        """
+        Get the styled, trace-less combined chart layout
+        
+        Built once on first use; callers must deep-copy it before adding traces.
+        """
+        if self._combined_template is not None:
+            return self._combined_template
+        
+        from plotly.subplots import make_subplots
+        
+        fig = make_subplots(
+            rows=3, cols=1,
+            subplot_titles=('Abonnenten', 'Aufrufe', 'Videos'),
+            vertical_spacing=0.1
+        )
         
         fig.update_layout(
-            title=f'Kanal-Entwicklung - {channel_name}',
             plot_bgcolor=self.colors['background'],
             paper_bgcolor=self.colors['background'],
             font=dict(color='white'),
@@ -309,10 +688,11 @@ class YouTubeCharts:
         
         # Update all subplots
         for i in range(1, 4):
-            fig.update_xaxes(gridcolor=self.colors['grid'], showgrid=True, row=i, col=1)
+            fig.update_xaxes(type='date', gridcolor=self.colors['grid'], showgrid=True, row=i, col=1)
             fig.update_yaxes(gridcolor=self.colors['grid'], showgrid=True, 
                            tickformat=',', row=i, col=1)
         
+        self._combined_template = fig
         return fig
     
     def create_stats_summary(self, channel_data: Dict) -> str:
@@ -325,32 +705,60 @@ class YouTubeCharts:
         Returns:
             Formatted statistics summary
         """
-        def format_number(num: int) -> str:
-            if num >= 1000000:
-                return f"{num/1000000:.1f}M"
-            elif num >= 1000:
-                return f"{num/1000:.1f}K"
-            return str(num)
+        description = channel_data['description']
+        if len(description) > 200:
+            description = description[:200] + '...'
         
-        stats = f"""
-📊 KANAL-STATISTIKEN
-{'='*50}
-
-📺 Kanal: {channel_data['title']}
-🔗 URL: https://youtube.com/@{channel_data.get('custom_url', 'N/A')}
-
-📈 Abonnenten: {format_number(channel_data['subscriber_count']):>10}
-👀 Aufrufe:    {format_number(channel_data['view_count']):>10}
-🎥 Videos:     {format_number(channel_data['video_count']):>10}
-
-📅 Erstellt: {datetime.fromisoformat(channel_data['published_at'].replace('Z', '+00:00')).strftime('%d.%m.%Y')}
-
-📝 Beschreibung:
-{channel_data['description'][:200]}{'...' if len(channel_data['description']) > 200 else ''}
-        """
+        subscribers, views, videos = format_numbers([
+            channel_data['subscriber_count'],
+            channel_data['view_count'],
+            channel_data['video_count']
+        ])
+        
+        stats = _SUMMARY_TMPL.substitute(
+            title=channel_data['title'],
+            custom_url=channel_data.get('custom_url', 'N/A'),
+            subscribers=subscribers.rjust(10),
+            views=views.rjust(10),
+            videos=videos.rjust(10),
+            published=_format_published(channel_data['published_at']),
+            description=description
+        )
         
         return stats.strip()
 
 
 # Create global instance
 youtube_charts = YouTubeCharts()
+
+
+def save_chart_image(chart_type: str, data: List[Dict], channel_name: str,
+                     out_path: str, dpi: int = CHART_SAVE_DPI) -> str:
+    """
+    Render a matplotlib chart and save it as an image file
+    
+    Module-level so it can be submitted to a process pool; each worker
+    renders with the non-interactive Agg backend.
+    
+    Args:
+        chart_type: 'subscribers', 'views' or 'videos'
+        data: List of data points
+        channel_name: Name of the channel
+        out_path: Output file path
+        dpi: Output resolution
+        
+    Returns:
+        The output file path
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    
+    create = {
+        'subscribers': youtube_charts.create_subscriber_chart,
+        'views': youtube_charts.create_view_chart,
+        'videos': youtube_charts.create_video_chart,
+    }[chart_type]
+    
+    fig = create(data, channel_name, use_plotly=False)
+    fig.savefig(out_path, dpi=dpi, bbox_inches='tight')
+    return out_path
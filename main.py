@@ -4,102 +4,133 @@ Provides a simple CLI for analyzing YouTube channel data
 """
 
 import argparse
+import functools
 import sys
 from datetime import datetime
-import matplotlib.pyplot as plt
 
-from youtube_api import youtube_api
-from charts import youtube_charts
+import youtube_api
 
 
 def format_number(num: int) -> str:
-    """Format large numbers with K/M suffixes"""
-    if num >= 1000000:
-        return f"{num/1000000:.1f}M"
-    elif num >= 1000:
-        return f"{num/1000:.1f}K"
-    return str(num)
+    """Format large numbers with K/M/B suffixes"""
+    from charts import format_numbers
+    return str(format_numbers(num))
 
 
+@functools.lru_cache(maxsize=1024)
 def format_date(date_str: str) -> str:
     """Format date string for display"""
     try:
         date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
         return date.strftime('%d.%m.%Y')
-    except:
+    except (ValueError, TypeError, AttributeError):
         return date_str
 
 
+_RULE = "=" * 60
+
+# Output block for a single video in print_recent_videos
+_VIDEO_TMPL = (
+    "\n{index}. {title}\n"
+    "   📅 {published}\n"
+    "   👀 {views} Aufrufe\n"
+    "   👍 {likes} Likes\n"
+    "   💬 {comments} Kommentare\n"
+)
+
+
 def print_channel_info(channel_data):
     """Print formatted channel information"""
-    print("\n" + "="*60)
-    print(f"📺 KANAL: {channel_data['title']}")
-    print("="*60)
+    parts = ["\n" + _RULE + "\n",
+             f"📺 KANAL: {channel_data['title']}\n",
+             _RULE + "\n"]
     
     if channel_data.get('custom_url'):
-        print(f"🔗 URL: https://youtube.com/@{channel_data['custom_url']}")
+        parts.append(f"🔗 URL: https://youtube.com/@{channel_data['custom_url']}\n")
     
-    print(f"📅 Erstellt: {format_date(channel_data['published_at'])}")
-    print(f"📈 Abonnenten: {format_number(channel_data['subscriber_count']):>10}")
-    print(f"👀 Aufrufe:    {format_number(channel_data['view_count']):>10}")
-    print(f"🎥 Videos:     {format_number(channel_data['video_count']):>10}")
+    parts.append(f"📅 Erstellt: {format_date(channel_data['published_at'])}\n")
+    parts.append(f"📈 Abonnenten: {format_number(channel_data['subscriber_count']):>10}\n")
+    parts.append(f"👀 Aufrufe:    {format_number(channel_data['view_count']):>10}\n")
+    parts.append(f"🎥 Videos:     {format_number(channel_data['video_count']):>10}\n")
     
     avg_views = channel_data['view_count'] // max(channel_data['video_count'], 1)
-    print(f"📊 Ø Aufrufe/Video: {format_number(avg_views):>10}")
+    parts.append(f"📊 Ø Aufrufe/Video: {format_number(avg_views):>10}\n")
     
-    print("\n📝 Beschreibung:")
+    parts.append("\n📝 Beschreibung:\n")
     description = channel_data['description']
     if len(description) > 200:
         description = description[:200] + "..."
-    print(f"   {description}")
-    print("="*60)
+    parts.append(f"   {description}\n")
+    parts.append(_RULE + "\n")
+    
+    # One write instead of a print (and flush) per line
+    sys.stdout.write(''.join(parts))
 
 
 def print_recent_videos(videos, limit=5):
     """Print recent videos information"""
     if not videos:
-        print("\n❌ Keine Videos gefunden.")
+        sys.stdout.write("\n❌ Keine Videos gefunden.\n")
         return
     
-    print(f"\n🎬 NEUESTE {min(limit, len(videos))} VIDEOS:")
-    print("-" * 60)
+    parts = [f"\n🎬 NEUESTE {min(limit, len(videos))} VIDEOS:\n", "-" * 60 + "\n"]
+    
+    from charts import format_numbers
     
-    for i, video in enumerate(videos[:limit]):
-        print(f"\n{i+1}. {video['title']}")
-        print(f"   📅 {format_date(video['published_at'])}")
-        print(f"   👀 {format_number(video['view_count'])} Aufrufe")
-        print(f"   👍 {format_number(video['like_count'])} Likes")
-        print(f"   💬 {format_number(video['comment_count'])} Kommentare")
+    shown = videos[:limit]
+    # Format all counts in one vectorized call, one row per video
+    counts = format_numbers([
+        [video.view_count, video.like_count, video.comment_count]
+        for video in shown
+    ]).tolist()
+    
+    for i, (video, (views, likes, comments)) in enumerate(zip(shown, counts)):
+        parts.append(_VIDEO_TMPL.format(
+            index=i + 1,
+            title=video.title,
+            published=format_date(video.published_at),
+            views=views,
+            likes=likes,
+            comments=comments,
+        ))
+    
+    sys.stdout.write(''.join(parts))
 
 
 def save_charts(channel_data, subscriber_history, view_history, video_history, output_dir="charts"):
     """Save charts as image files"""
     import os
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+    from charts import save_chart_image
     
     # Create output directory
     os.makedirs(output_dir, exist_ok=True)
     
     channel_name = channel_data['title'].replace(' ', '_').replace('/', '_')
     
-    print(f"\n💾 Speichere Diagramme in '{output_dir}/'...")
+    sys.stdout.write(f"\n💾 Speichere Diagramme in '{output_dir}/'...\n")
     
-    # Subscriber chart
-    sub_fig = youtube_charts.create_subscriber_chart(subscriber_history, channel_data['title'], use_plotly=False)
-    if sub_fig:
-        sub_fig.savefig(f"{output_dir}/{channel_name}_abonnenten.png", dpi=300, bbox_inches='tight')
-        print(f"   ✅ Abonnenten-Diagramm gespeichert")
-    
-    # View chart
-    view_fig = youtube_charts.create_view_chart(view_history, channel_data['title'], use_plotly=False)
-    if view_fig:
-        view_fig.savefig(f"{output_dir}/{channel_name}_aufrufe.png", dpi=300, bbox_inches='tight')
-        print(f"   ✅ Aufruf-Diagramm gespeichert")
+    # (chart type, data, file suffix, label)
+    charts = [
+        ('subscribers', subscriber_history, 'abonnenten', 'Abonnenten-Diagramm'),
+        ('views', view_history, 'aufrufe', 'Aufruf-Diagramm'),
+        ('videos', video_history, 'videos', 'Video-Diagramm'),
+    ]
+    charts = [chart for chart in charts if len(chart[1])]
+    if not charts:
+        return
     
-    # Video chart
-    video_fig = youtube_charts.create_video_chart(video_history, channel_data['title'], use_plotly=False)
-    if video_fig:
-        video_fig.savefig(f"{output_dir}/{channel_name}_videos.png", dpi=300, bbox_inches='tight')
-        print(f"   ✅ Video-Diagramm gespeichert")
+    # Render the charts in parallel, they share no state
+    with ProcessPoolExecutor(max_workers=len(charts)) as executor:
+        futures = {
+            executor.submit(save_chart_image, chart_type, data, channel_data['title'],
+                            f"{output_dir}/{channel_name}_{suffix}.png"): label
+            for chart_type, data, suffix, label in charts
+        }
+        for future in as_completed(futures):
+            future.result()
+            # Progress stays per chart, one write per completed chart
+            sys.stdout.write(f"   ✅ {futures[future]} gespeichert\n")
 
 
 def main():
@@ -155,7 +186,7 @@ Beispiele:
         print(f"🔍 Lade Daten für Kanal: {args.channel}")
         
         # Get comprehensive channel statistics
-        stats = youtube_api.get_comprehensive_stats(args.channel)
+        stats = youtube_api.youtube_api.get_comprehensive_stats(args.channel)
         channel_data = stats['channel']
         videos = stats['videos']
         subscriber_history = stats['subscriber_history']
@@ -3,46 +3,363 @@ Streamlit Web Application for YouTube Statistics Tracker
 Provides an interactive web interface for analyzing YouTube channel data
 """
 
+import functools
+import heapq
+import html
+
 import streamlit as st
 import pandas as pd
 from datetime import datetime
-import plotly.graph_objects as go
-from plotly.subplots import make_subplots
-import time
 
 from youtube_api import youtube_api
-from charts import youtube_charts
-from config import CHART_COLORS
+from charts import youtube_charts, format_numbers
+from config import STATS_CACHE_TTL
 
 
+@functools.lru_cache(maxsize=2048)
 def format_number(num: int) -> str:
-    """Format large numbers with K/M suffixes"""
-    if num >= 1000000:
-        return f"{num/1000000:.1f}M"
-    elif num >= 1000:
-        return f"{num/1000:.1f}K"
-    return str(num)
+    """Format large numbers with K/M/B suffixes"""
+    return str(format_numbers(num))
+
+
+@functools.lru_cache(maxsize=4096)
+def _format_date_str(date_str: str) -> str:
+    """Format an ISO date string for display, memoized per string"""
+    try:
+        if 'T' in date_str:
+            date = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
+        else:
+            date = datetime.fromisoformat(date_str)
+        return date.strftime('%d.%m.%Y')
+    except ValueError as e:
+        print(f"Date formatting error: {e}")
+        return date_str
 
 
 def format_date(date_input) -> str:
     """Format date string or datetime for display"""
+    if isinstance(date_input, str):
+        # API timestamps recur across reruns, so strings go through the cache
+        return _format_date_str(date_input)
+    
     try:
-        if isinstance(date_input, str):
-            # Handle string input
-            if 'T' in date_input:
-                date = datetime.fromisoformat(date_input.replace('Z', '+00:00'))
-            else:
-                date = datetime.fromisoformat(date_input)
-        else:
-            # Handle pandas datetime or other datetime objects
-            date = pd.to_datetime(date_input)
-        
+        # Handle pandas datetime or other datetime objects; an explicit
+        # format avoids pandas' per-element format inference
+        date = pd.to_datetime(date_input, format='ISO8601', utc=True)
         return date.strftime('%d.%m.%Y')
     except Exception as e:
         print(f"Date formatting error: {e}")
         return str(date_input)
 
 
+# Custom CSS for the page layout, cards and video list
+_CSS = """
+.main-header {
+    background: linear-gradient(90deg, #FF0000, #CC0000);
+    padding: 2rem;
+    border-radius: 10px;
+    margin-bottom: 2rem;
+    text-align: center;
+}
+.main-header h1 {
+    color: white;
+    margin: 0;
+    font-size: 3rem;
+}
+.main-header p {
+    color: #FFCCCC;
+    margin: 0.5rem 0 0 0;
+    font-size: 1.2rem;
+}
+.stats-card {
+    background: #272727;
+    padding: 1.5rem;
+    border-radius: 10px;
+    border-left: 4px solid #FF0000;
+    margin: 1rem 0;
+}
+.metric-value {
+    font-size: 2rem;
+    font-weight: bold;
+    color: #FF0000;
+}
+.metric-label {
+    color: #CCCCCC;
+    font-size: 1rem;
+}
+.stats-row {
+    display: flex;
+    gap: 1rem;
+}
+.stats-row .stats-card {
+    flex: 1;
+}
+
+/* Fix text overlap and layout issues */
+.stContainer {
+    margin-bottom: 1rem;
+}
+
+.video-container {
+    margin-bottom: 2rem;
+    padding: 1rem;
+    border: 1px solid #333;
+    border-radius: 8px;
+    background: #1a1a1a;
+}
+
+.video-title {
+    font-size: 1.1rem;
+    font-weight: bold;
+    margin-bottom: 0.5rem;
+    line-height: 1.4;
+    word-wrap: break-word;
+}
+
+.video-stats {
+    display: flex;
+    gap: 1rem;
+    margin-top: 0.5rem;
+}
+
+.video-stat {
+    background: #333;
+    padding: 0.5rem;
+    border-radius: 4px;
+    text-align: center;
+    min-width: 80px;
+}
+
+.video-body {
+    display: flex;
+    gap: 1rem;
+    align-items: flex-start;
+}
+
+.video-body img {
+    width: 200px;
+    border-radius: 4px;
+}
+
+.video-date {
+    font-size: 0.9rem;
+    color: #888;
+    margin-top: 0.5rem;
+}
+
+/* Ensure proper spacing */
+.stMarkdown {
+    margin-bottom: 0.5rem;
+}
+
+/* Fix caption styling */
+.stCaption {
+    font-size: 0.9rem;
+    color: #888;
+    margin-top: 0.25rem;
+}
+"""
+
+
+# HTML for one entry of the recent videos list
+_VIDEO_CARD_TMPL = (
+    '<div class="video-container">'
+    '<div class="video-title">{index}. {title}</div>'
+    '<div class="video-body">'
+    '<img src="{thumbnail}" alt="">'
+    '<div>'
+    '<div class="video-stats">'
+    '<div class="video-stat">👀 Aufrufe<br><b>{views}</b></div>'
+    '<div class="video-stat">👍 Likes<br><b>{likes}</b></div>'
+    '<div class="video-stat">💬 Kommentare<br><b>{comments}</b></div>'
+    '</div>'
+    '<div class="video-date">📅 {published}</div>'
+    '</div>'
+    '</div>'
+    '</div>'
+)
+
+
+def stats_cards_html(channel_data: dict, avg_views: int) -> str:
+    """
+    Build the channel statistic cards as a single HTML block
+    
+    Emitting one block instead of one st.markdown per card saves three
+    element deltas on every rerun.
+    
+    Args:
+        channel_data: Channel information dictionary
+        avg_views: Average views per video
+        
+    Returns:
+        HTML string with one stats card per metric
+    """
+    cards = [
+        (channel_data['subscriber_count'], 'Abonnenten'),
+        (channel_data['view_count'], 'Aufrufe'),
+        (channel_data['video_count'], 'Videos'),
+        (avg_views, 'Ø Aufrufe/Video'),
+    ]
+    return '<div class="stats-row">' + ''.join(
+        f'<div class="stats-card"><div class="metric-value">{format_number(value)}</div>'
+        f'<div class="metric-label">{label}</div></div>'
+        for value, label in cards
+    ) + '</div>'
+
+
+def videos_html(videos: list) -> str:
+    """
+    Build the recent videos list as a single HTML block
+    
+    Args:
+        videos: Video records in display order
+        
+    Returns:
+        HTML string with one card per video
+    """
+    if not videos:
+        return ''
+    
+    # Extract each field once up front, then zip the columns
+    titles = [video.title for video in videos]
+    thumbnails = [video.thumbnails['medium']['url'] for video in videos]
+    dates = [format_date(video.published_at) for video in videos]
+    counts = format_numbers([
+        [video.view_count, video.like_count, video.comment_count]
+        for video in videos
+    ]).tolist()
+    
+    cards = []
+    for i, (title, thumbnail, published, (views, likes, comments)) in enumerate(
+            zip(titles, thumbnails, dates, counts)):
+        cards.append(_VIDEO_CARD_TMPL.format(
+            index=i + 1,
+            title=html.escape(title if len(title) <= 100 else title[:100] + '...'),
+            thumbnail=html.escape(thumbnail),
+            views=views,
+            likes=likes,
+            comments=comments,
+            published=published,
+        ))
+    return ''.join(cards)
+
+
+@st.cache_data(show_spinner=False)
+def summary_csv(subscribers: int, views: int, videos: int, avg_views: int) -> bytes:
+    """
+    Build the channel statistics CSV export
+    
+    Args:
+        subscribers: Subscriber count
+        views: Total view count
+        videos: Video count
+        avg_views: Average views per video
+        
+    Returns:
+        Encoded CSV content
+    """
+    summary_df = pd.DataFrame({
+        'Metrik': ['Abonnenten', 'Aufrufe', 'Videos', 'Durchschnittliche Aufrufe pro Video'],
+        'Wert': [subscribers, views, videos, avg_views]
+    })
+    return summary_df.to_csv(index=False).encode()
+
+
+@st.cache_data(show_spinner=False)
+def historical_csv(subscriber_history: pd.DataFrame, view_history: pd.DataFrame,
+                   video_history: pd.DataFrame) -> bytes:
+    """
+    Build the historical data CSV export
+    
+    The histories are date-indexed DataFrames, so they are aligned on their
+    index in a single concat.
+    
+    Args:
+        subscriber_history: Subscriber history
+        view_history: View history
+        video_history: Video count history
+        
+    Returns:
+        Encoded CSV content
+    """
+    historical_df = pd.concat([subscriber_history, view_history, video_history], axis=1)
+    historical_df.index = historical_df.index.strftime('%Y-%m-%d')
+    historical_df = historical_df.rename(
+        columns={'subscribers': 'Abonnenten', 'views': 'Aufrufe', 'videos': 'Videos'})
+    return historical_df.rename_axis('Datum').to_csv().encode()
+
+
+@st.cache_data(ttl=STATS_CACHE_TTL, show_spinner=False)
+def load_stats(channel_input: str) -> dict:
+    """
+    Fetch comprehensive channel statistics, cached per channel input
+    
+    Streamlit reruns the whole script on every interaction, so without the
+    cache every rerun of a search would hit the YouTube API again. The cache
+    is shared by all sessions of the server process, so users looking at the
+    same channel share one fetch.
+    
+    Args:
+        channel_input: Channel ID or username
+        
+    Returns:
+        Dictionary as returned by youtube_api.get_comprehensive_stats
+    """
+    return youtube_api.get_comprehensive_stats(channel_input)
+
+
+def build_figures(stats: dict) -> dict:
+    """
+    Build all channel charts once per fetch
+    
+    The figures are kept in the session state so that tab switches and other
+    reruns only re-emit them instead of rebuilding them.
+    
+    Args:
+        stats: Dictionary as returned by load_stats
+        
+    Returns:
+        Dictionary of plotly figures keyed by chart type (None if no data)
+    """
+    title = stats['channel']['title']
+    return {
+        'combined': youtube_charts.create_combined_chart(
+            stats['subscriber_history'], stats['view_history'], stats['video_history'], title,
+            channel_id=stats['channel']['id']),
+        'subscribers': youtube_charts.create_subscriber_chart(stats['subscriber_history'], title),
+        'views': youtube_charts.create_view_chart(stats['view_history'], title),
+        'videos': youtube_charts.create_video_chart(stats['video_history'], title),
+    }
+
+
+@st.cache_data(show_spinner=False)
+def sample_history():
+    """
+    Create sample data for the welcome screen demonstration
+    
+    Returns:
+        Tuple of (subscriber, view, video) history lists
+    """
+    import numpy as np
+    dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='ME')
+    sample_data = {
+        'subscribers': [1000 + i * 100 + np.random.randint(-50, 150) for i in range(len(dates))],
+        'views': [10000 + i * 1000 + np.random.randint(-500, 1500) for i in range(len(dates))],
+        'videos': [10 + i + np.random.randint(-2, 3) for i in range(len(dates))]
+    }
+    
+    sample_subscriber_data = [{'date': d.strftime('%Y-%m-%d'), 'subscribers': s} for d, s in zip(dates, sample_data['subscribers'])]
+    sample_view_data = [{'date': d.strftime('%Y-%m-%d'), 'views': v} for d, v in zip(dates, sample_data['views'])]
+    sample_video_data = [{'date': d.strftime('%Y-%m-%d'), 'videos': v} for d, v in zip(dates, sample_data['videos'])]
+    return sample_subscriber_data, sample_view_data, sample_video_data
+
+
+@st.cache_resource(show_spinner=False)
+def _inject_css() -> None:
+    """Inject the custom CSS; the cached call replays the element on reruns"""
+    st.markdown(f"<style>{_CSS}</style>", unsafe_allow_html=True)
+
+
 def main():
     """Main Streamlit application"""
     
@@ -55,90 +372,7 @@ def main():
     )
     
     # Custom CSS
-    st.markdown("""
-    <style>
-    .main-header {
-        background: linear-gradient(90deg, #FF0000, #CC0000);
-        padding: 2rem;
-        border-radius: 10px;
-        margin-bottom: 2rem;
-        text-align: center;
-    }
-    .main-header h1 {
-        color: white;
-        margin: 0;
-        font-size: 3rem;
-    }
-    .main-header p {
-        color: #FFCCCC;
-        margin: 0.5rem 0 0 0;
-        font-size: 1.2rem;
-    }
-    .stats-card {
-        background: #272727;
-        padding: 1.5rem;
-        border-radius: 10px;
-        border-left: 4px solid #FF0000;
-        margin: 1rem 0;
-    }
-    .metric-value {
-        font-size: 2rem;
-        font-weight: bold;
-        color: #FF0000;
-    }
-    .metric-label {
-        color: #CCCCCC;
-        font-size: 1rem;
-    }
-    
-    /* Fix text overlap and layout issues */
-    .stContainer {
-        margin-bottom: 1rem;
-    }
-    
-    .video-container {
-        margin-bottom: 2rem;
-        padding: 1rem;
-        border: 1px solid #333;
-        border-radius: 8px;
-        background: #1a1a1a;
-    }
-    
-    .video-title {
-        font-size: 1.1rem;
-        font-weight: bold;
-        margin-bottom: 0.5rem;
-        line-height: 1.4;
-        word-wrap: break-word;
-    }
-    
-    .video-stats {
-        display: flex;
-        gap: 1rem;
-        margin-top: 0.5rem;
-    }
-    
-    .video-stat {
-        background: #333;
-        padding: 0.5rem;
-        border-radius: 4px;
-        text-align: center;
-        min-width: 80px;
-    }
-    
-    /* Ensure proper spacing */
-    .stMarkdown {
-        margin-bottom: 0.5rem;
-    }
-    
-    /* Fix caption styling */
-    .stCaption {
-        font-size: 0.9rem;
-        color: #888;
-        margin-top: 0.25rem;
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    _inject_css()
     
     # Header
     st.markdown("""
@@ -162,6 +396,16 @@ def main():
         # Search button
         search_button = st.button("🔍 Kanal analysieren", type="primary", use_container_width=True)
         
+        # Refresh button, bypasses the cached stats for this channel
+        refresh_button = st.button(
+            "🔄 Daten neu laden",
+            use_container_width=True,
+            help="Lädt die Kanal-Daten erneut von der YouTube API statt aus dem Cache"
+        )
+        if refresh_button and channel_input:
+            youtube_api.invalidate(channel_input)
+            load_stats.clear(channel_input)
+        
         # Example channels
         st.markdown("### 📋 Beispiel-Kanäle")
         example_channels = {
@@ -177,20 +421,38 @@ def main():
                 st.rerun()
     
     # Main content area
-    if search_button and channel_input:
+    if (search_button or refresh_button) and channel_input:
         with st.spinner("Lade Kanal-Daten..."):
             try:
                 # Get channel data
-                stats = youtube_api.get_comprehensive_stats(channel_input)
+                stats = load_stats(channel_input)
                 channel_data = stats['channel']
                 videos = stats['videos']
                 
+                description = channel_data['description']
+                channel_data['description_preview'] = (
+                    description if len(description) <= 300 else description[:300] + "...")
+                
                 # Store in session state
                 st.session_state.channel_data = channel_data
                 st.session_state.videos = videos
                 st.session_state.subscriber_history = stats['subscriber_history']
                 st.session_state.view_history = stats['view_history']
                 st.session_state.video_history = stats['video_history']
+                st.session_state.figs = build_figures(stats)
+                
+                # Render the static HTML sections once per fetch, reruns
+                # (tab switches, exports) only re-emit them
+                avg_views = channel_data['view_count'] // max(channel_data['video_count'], 1)
+                st.session_state.avg_views = avg_views
+                st.session_state.stats_html = stats_cards_html(channel_data, avg_views)
+                if videos:
+                    # Six newest videos; ISO 8601 timestamps compare chronologically
+                    # as strings, so no full sort or DataFrame is needed
+                    top_videos = heapq.nlargest(6, videos, key=lambda v: v.published_at)
+                    st.session_state.videos_html = videos_html(top_videos)
+                else:
+                    st.session_state.videos_html = None
                 
             except Exception as e:
                 error_msg = str(e)
@@ -231,49 +493,13 @@ def main():
             
             st.markdown(f"**Erstellt:** {format_date(channel_data['published_at'])}")
             
-            # Description
-            description = channel_data['description']
-            if len(description) > 300:
-                description = description[:300] + "..."
-            st.markdown(f"**Beschreibung:** {description}")
+            # Description, shortened once per fetch
+            st.markdown(f"**Beschreibung:** {channel_data['description_preview']}")
         
         # Statistics cards
         st.markdown("### 📊 Kanal-Statistiken")
         
-        col1, col2, col3, col4 = st.columns(4)
-        
-        with col1:
-            st.markdown(f"""
-            <div class="stats-card">
-                <div class="metric-value">{format_number(channel_data['subscriber_count'])}</div>
-                <div class="metric-label">Abonnenten</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col2:
-            st.markdown(f"""
-            <div class="stats-card">
-                <div class="metric-value">{format_number(channel_data['view_count'])}</div>
-                <div class="metric-label">Aufrufe</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col3:
-            st.markdown(f"""
-            <div class="stats-card">
-                <div class="metric-value">{format_number(channel_data['video_count'])}</div>
-                <div class="metric-label">Videos</div>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            avg_views = channel_data['view_count'] // max(channel_data['video_count'], 1)
-            st.markdown(f"""
-            <div class="stats-card">
-                <div class="metric-value">{format_number(avg_views)}</div>
-                <div class="metric-label">Ø Aufrufe/Video</div>
-            </div>
-            """, unsafe_allow_html=True)
+        st.markdown(st.session_state.stats_html, unsafe_allow_html=True)
         
         # Charts section
         st.markdown("### 📈 Kanal-Entwicklung")
@@ -281,88 +507,32 @@ def main():
         # Chart tabs
         tab1, tab2, tab3, tab4 = st.tabs(["📊 Alle Diagramme", "👥 Abonnenten", "👀 Aufrufe", "🎥 Videos"])
         
+        figs = st.session_state.figs
+        
         with tab1:
             # Combined chart
-            combined_fig = youtube_charts.create_combined_chart(
-                st.session_state.subscriber_history,
-                st.session_state.view_history,
-                st.session_state.video_history,
-                channel_data['title']
-            )
-            st.plotly_chart(combined_fig, use_container_width=True)
+            st.plotly_chart(figs['combined'], use_container_width=True)
         
         with tab2:
             # Subscriber chart
-            sub_fig = youtube_charts.create_subscriber_chart(
-                st.session_state.subscriber_history,
-                channel_data['title']
-            )
-            if sub_fig:
-                st.plotly_chart(sub_fig, use_container_width=True)
+            if figs['subscribers']:
+                st.plotly_chart(figs['subscribers'], use_container_width=True)
         
         with tab3:
             # View chart
-            view_fig = youtube_charts.create_view_chart(
-                st.session_state.view_history,
-                channel_data['title']
-            )
-            if view_fig:
-                st.plotly_chart(view_fig, use_container_width=True)
+            if figs['views']:
+                st.plotly_chart(figs['views'], use_container_width=True)
         
         with tab4:
             # Video chart
-            video_fig = youtube_charts.create_video_chart(
-                st.session_state.video_history,
-                channel_data['title']
-            )
-            if video_fig:
-                st.plotly_chart(video_fig, use_container_width=True)
+            if figs['videos']:
+                st.plotly_chart(figs['videos'], use_container_width=True)
         
         # Recent videos section
         st.markdown("### 🎬 Neueste Videos")
         
-        if st.session_state.videos:
-            # Create videos dataframe
-            videos_df = pd.DataFrame(st.session_state.videos)
-            videos_df['published_at'] = pd.to_datetime(videos_df['published_at'])
-            videos_df = videos_df.sort_values('published_at', ascending=False)
-            
-            # Display videos in a cleaner format
-            for i, video in enumerate(videos_df.head(6).iterrows()):
-                video_data = video[1]
-                
-                # Create a container for each video with custom styling
-                st.markdown(f"""
-                <div class="video-container">
-                    <div class="video-title">{i+1}. {video_data['title'][:100]}{'...' if len(video_data['title']) > 100 else ''}</div>
-                </div>
-                """, unsafe_allow_html=True)
-                
-                col1, col2 = st.columns([1, 3])
-                
-                with col1:
-                    st.image(
-                        video_data['thumbnails']['medium']['url'],
-                        width=200
-                    )
-                
-                with col2:
-                    # Video stats in a clean format using metrics
-                    col_stats1, col_stats2, col_stats3 = st.columns(3)
-                    
-                    with col_stats1:
-                        st.metric("👀 Aufrufe", format_number(video_data['view_count']))
-                    
-                    with col_stats2:
-                        st.metric("👍 Likes", format_number(video_data['like_count']))
-                    
-                    with col_stats3:
-                        st.metric("💬 Kommentare", format_number(video_data['comment_count']))
-                    
-                    # Date
-                    st.caption(f"📅 {format_date(video_data['published_at'])}")
-                
-                st.divider()
+        if st.session_state.videos_html:
+            st.markdown(st.session_state.videos_html, unsafe_allow_html=True)
         else:
             st.info("Keine Videos gefunden.")
         
@@ -371,44 +541,36 @@ def main():
         
         col1, col2 = st.columns(2)
         
+        # The CSV is only built when a download is clicked, and the download
+        # doesn't rerun the page
         with col1:
-            if st.button("📊 Statistiken als CSV exportieren"):
-                # Create summary data
-                summary_data = {
-                    'Metrik': ['Abonnenten', 'Aufrufe', 'Videos', 'Durchschnittliche Aufrufe pro Video'],
-                    'Wert': [
-                        channel_data['subscriber_count'],
-                        channel_data['view_count'],
-                        channel_data['video_count'],
-                        channel_data['view_count'] // max(channel_data['video_count'], 1)
-                    ]
-                }
-                summary_df = pd.DataFrame(summary_data)
-                csv = summary_df.to_csv(index=False)
-                st.download_button(
-                    label="📥 CSV herunterladen",
-                    data=csv,
-                    file_name=f"{channel_data['title']}_statistiken.csv",
-                    mime="text/csv"
-                )
+            st.download_button(
+                label="📊 Statistiken als CSV herunterladen",
+                data=functools.partial(
+                    summary_csv,
+                    channel_data['subscriber_count'],
+                    channel_data['view_count'],
+                    channel_data['video_count'],
+                    st.session_state.avg_views
+                ),
+                file_name=f"{channel_data['title']}_statistiken.csv",
+                mime="text/csv",
+                on_click="ignore"
+            )
         
         with col2:
-            if st.button("📈 Historische Daten als CSV exportieren"):
-                # Combine all historical data
-                historical_data = {
-                    'Datum': [point['date'] for point in st.session_state.subscriber_history],
-                    'Abonnenten': [point['subscribers'] for point in st.session_state.subscriber_history],
-                    'Aufrufe': [point['views'] for point in st.session_state.view_history],
-                    'Videos': [point['videos'] for point in st.session_state.video_history]
-                }
-                historical_df = pd.DataFrame(historical_data)
-                csv = historical_df.to_csv(index=False)
-                st.download_button(
-                    label="📥 CSV herunterladen",
-                    data=csv,
-                    file_name=f"{channel_data['title']}_historische_daten.csv",
-                    mime="text/csv"
-                )
+            st.download_button(
+                label="📈 Historische Daten als CSV herunterladen",
+                data=functools.partial(
+                    historical_csv,
+                    st.session_state.subscriber_history,
+                    st.session_state.view_history,
+                    st.session_state.video_history
+                ),
+                file_name=f"{channel_data['title']}_historische_daten.csv",
+                mime="text/csv",
+                on_click="ignore"
+            )
     
     else:
         # Welcome screen
@@ -434,30 +596,20 @@ def main():
         Verwenden Sie die Beispiel-Kanäle in der Seitenleiste für einen schnellen Start!
         """)
         
-        # Show example charts
-        st.markdown("### 📊 Beispiel-Diagramme")
-        
-        # Create sample data for demonstration
-        import numpy as np
-        dates = pd.date_range(start='2023-01-01', end='2023-12-31', freq='ME')
-        sample_data = {
-            'subscribers': [1000 + i * 100 + np.random.randint(-50, 150) for i in range(len(dates))],
-            'views': [10000 + i * 1000 + np.random.randint(-500, 1500) for i in range(len(dates))],
-            'videos': [10 + i + np.random.randint(-2, 3) for i in range(len(dates))]
-        }
-        
-        sample_subscriber_data = [{'date': d.strftime('%Y-%m-%d'), 'subscribers': s} for d, s in zip(dates, sample_data['subscribers'])]
-        sample_view_data = [{'date': d.strftime('%Y-%m-%d'), 'views': v} for d, v in zip(dates, sample_data['views'])]
-        sample_video_data = [{'date': d.strftime('%Y-%m-%d'), 'videos': v} for d, v in zip(dates, sample_data['videos'])]
-        
-        # Show sample charts
-        sample_fig = youtube_charts.create_combined_chart(
-            sample_subscriber_data,
-            sample_view_data, 
-            sample_video_data,
-            "Beispiel-Kanal"
-        )
-        st.plotly_chart(sample_fig, use_container_width=True)
+        # Example charts, only built when requested
+        if st.checkbox("📊 Beispiel-Diagramme zeigen", value=False):
+            st.markdown("### 📊 Beispiel-Diagramme")
+            
+            sample_subscriber_data, sample_view_data, sample_video_data = sample_history()
+            
+            # Show sample charts
+            sample_fig = youtube_charts.create_combined_chart(
+                sample_subscriber_data,
+                sample_view_data, 
+                sample_video_data,
+                "Beispiel-Kanal"
+            )
+            st.plotly_chart(sample_fig, use_container_width=True)
 
 
 if __name__ == "__main__":
@@ -3,49 +3,27 @@ Test script for YTGraphX
 Verifies that all components are working correctly
 """
 
+import importlib.util
+import json
+import os
 import sys
-import traceback
+from unittest import mock
+
+# Cached API responses, so repeated runs don't spend quota
+CACHE_DIR = '.cache'
 
 def test_imports():
     """Test if all required modules can be imported"""
     print("🔍 Testing imports...")
     
-    try:
-        import googleapiclient.discovery
-        print("   ✅ googleapiclient")
-    except ImportError as e:
-        print(f"   ❌ googleapiclient: {e}")
-        return False
-    
-    try:
-        import matplotlib.pyplot as plt
-        print("   ✅ matplotlib")
-    except ImportError as e:
-        print(f"   ❌ matplotlib: {e}")
-        return False
-    
-    try:
-        import plotly.graph_objects as go
-        print("   ✅ plotly")
-    except ImportError as e:
-        print(f"   ❌ plotly: {e}")
-        return False
+    # find_spec only locates the modules, it doesn't execute them
+    results = []
+    for name in ('googleapiclient', 'matplotlib', 'plotly', 'pandas', 'streamlit'):
+        spec = importlib.util.find_spec(name)
+        print(f"   {'✅' if spec else '❌'} {name}")
+        results.append(spec is not None)
     
-    try:
-        import pandas as pd
-        print("   ✅ pandas")
-    except ImportError as e:
-        print(f"   ❌ pandas: {e}")
-        return False
-    
-    try:
-        import streamlit as st
-        print("   ✅ streamlit")
-    except ImportError as e:
-        print(f"   ❌ streamlit: {e}")
-        return False
-    
-    return True
+    return all(results)
 
 def test_youtube_api():
     """Test YouTube API connection"""
@@ -55,10 +33,26 @@ def test_youtube_api():
         from youtube_api import youtube_api
         print("   ✅ YouTube API module loaded")
         
+        # Only hit the network when credentials are provided explicitly
+        if not os.environ.get('YT_API_KEY'):
+            print("   ⏭️  Skipping API call (YT_API_KEY not set)")
+            return True
+        
+        cache_file = os.path.join(CACHE_DIR, 'test_channel.json')
+        if os.path.exists(cache_file):
+            with open(cache_file, encoding='utf-8') as f:
+                channel_data = json.load(f)
+            print("   ✅ Using cached API response")
+            print(f"   📺 Test channel: {channel_data['title']}")
+            return True
+        
         # Test with a simple channel (this might fail if API key is invalid)
         try:
             channel_data = youtube_api.get_channel_info("@google")
             print("   ✅ API connection successful")
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(cache_file, 'w', encoding='utf-8') as f:
+                json.dump(channel_data, f)
             print(f"   📺 Test channel: {channel_data['title']}")
             return True
         except Exception as e:
@@ -98,25 +92,288 @@ def test_charts():
         print(f"   ❌ Charts module error: {e}")
         return False
 
+def test_format_numbers():
+    """Test number formatting with K/M/B suffixes"""
+    print("\n🔍 Testing number formatting...")
+    from charts import format_numbers
+    
+    values = [0, 999, 1_000, 1_500, 999_999, 1_000_000, 2_500_000, 1_000_000_000, 7_300_000_000]
+    expected = ['0', '999', '1.0K', '1.5K', '1000.0K', '1.0M', '2.5M', '1.0B', '7.3B']
+    result = format_numbers(values).tolist()
+    assert result == expected, result
+    print("   ✅ Suffix boundaries formatted correctly")
+    
+    result = format_numbers([[1, 2_000], [3_000_000, 4_000_000_000]]).tolist()
+    assert result == [['1', '2.0K'], ['3.0M', '4.0B']], result
+    print("   ✅ Input shape preserved")
+    return True
+
+def test_downsampling():
+    """Test the M4 and min/max downsamplers against brute-force versions"""
+    print("\n🔍 Testing chart downsampling...")
+    import numpy as np
+    from charts import _m4_downsample, _minmax_downsample
+    
+    rng = np.random.default_rng(0)
+    for _ in range(300):
+        n = int(rng.integers(2, 400))
+        x = np.cumsum(rng.integers(0, 5, n))
+        y = rng.integers(0, 20, n)
+        
+        # M4: first, last, min and max of each equal-width x bucket
+        n_pixels = int(rng.integers(1, 50))
+        expected = set(range(n))
+        if n > 4 * n_pixels:
+            edges = np.linspace(x[0], x[-1], n_pixels + 1)[:-1]
+            buckets = np.searchsorted(edges, x, side='right') - 1
+            expected = set()
+            for bucket in np.unique(buckets):
+                members = np.flatnonzero(buckets == bucket)
+                expected.update((members[0], members[-1],
+                                 members[np.argmin(y[members])], members[np.argmax(y[members])]))
+        idx = sorted(expected)
+        dx, dy = _m4_downsample(x, y, n_pixels)
+        assert dx.tolist() == x[idx].tolist() and dy.tolist() == y[idx].tolist(), ('m4', n, n_pixels)
+        
+        # Min/max: endpoints plus min and max of each equal-count bucket
+        n_out = int(rng.integers(2, 100))
+        expected = set(range(n))
+        if n > n_out:
+            starts = np.linspace(0, n, n_out // 2, endpoint=False).astype(np.int64)
+            expected = {0, n - 1}
+            for start, end in zip(starts, np.append(starts[1:], n)):
+                expected.update((start + np.argmin(y[start:end]), start + np.argmax(y[start:end])))
+        idx = sorted(expected)
+        dx, dy = _minmax_downsample(x, y, n_out)
+        assert dx.tolist() == x[idx].tolist() and dy.tolist() == y[idx].tolist(), ('minmax', n, n_out)
+    print("   ✅ Downsampling matches brute force on 300 random series")
+    return True
+
+def test_api_cache():
+    """Test the in-process API response cache"""
+    print("\n🔍 Testing API cache...")
+    import youtube_api
+    from config import API_CACHE_TTL
+    
+    api = youtube_api.YouTubeAPI('test-key')
+    fetches = []
+    def fetch(value):
+        fetches.append(value)
+        return value
+    
+    with mock.patch.object(youtube_api.time, 'monotonic', return_value=1000.0) as clock:
+        assert api._cached(('info', 'a'), lambda: fetch(1)) == 1
+        assert api._cached(('info', 'a'), lambda: fetch(2)) == 1
+        assert fetches == [1], fetches
+        print("   ✅ Cached value reused")
+        
+        clock.return_value = 1000.0 + API_CACHE_TTL + 1
+        assert api._cached(('info', 'a'), lambda: fetch(3)) == 3
+        print("   ✅ Expired value refetched")
+        
+        with mock.patch.object(youtube_api, 'API_CACHE_SIZE', 2):
+            for i in range(5):
+                api._cached(('videos', i), lambda: fetch(i))
+        assert len(api._cache) == 2 and ('videos', 4) in api._cache, list(api._cache)
+        print("   ✅ Cache size capped")
+        
+        api._cached(('info', 'chan'), lambda: {'id': 'UC1'})
+        api._cached(('stats', 'chan'), lambda: {})
+        api._cached(('videos', 'UC1', 50), lambda: [])
+        api.invalidate('@Chan')
+        assert not any(key in api._cache for key in
+                       [('info', 'chan'), ('stats', 'chan'), ('videos', 'UC1', 50)]), list(api._cache)
+        print("   ✅ Channel entries invalidated")
+    
+    assert youtube_api._identifier_key('@Foo') == youtube_api._identifier_key('foo')
+    assert youtube_api._identifier_key('UC' + 'A' * 22) != youtube_api._identifier_key('UC' + 'a' * 22)
+    print("   ✅ Handles case-folded, channel IDs kept")
+    return True
+
+def test_http_cache():
+    """Test the on-disk HTTP cache and its size cap"""
+    print("\n🔍 Testing HTTP cache...")
+    import tempfile
+    import youtube_api
+    
+    with tempfile.TemporaryDirectory() as directory, \
+            mock.patch.object(youtube_api, 'HTTP_CACHE_MAX_ENTRIES', 4), \
+            mock.patch.object(youtube_api.os, 'scandir', wraps=os.scandir) as scandir:
+        cache = youtube_api._HttpCache(directory)
+        assert cache.get('missing') is None
+        for i in range(7):
+            cache.set(f'key{i}', b'x' * i)
+        assert len(os.listdir(directory)) == 4, os.listdir(directory)
+        assert cache.get('key6') == b'x' * 6
+        assert scandir.call_count == 2, scandir.call_count
+        print("   ✅ Cache capped with 2 directory scans for 7 writes")
+        
+        cache.delete('key6')
+        assert cache.get('key6') is None
+        print("   ✅ Entries deleted")
+    return True
+
+# Minimal channels.list item accepted by YouTubeAPI._format_channel_data
+TEST_CHANNEL = {
+    'id': 'UC' + 'a' * 22,
+    'snippet': {'title': 'Test Channel', 'description': '', 'customUrl': '@testchannel',
+                'publishedAt': '2020-01-01T00:00:00Z', 'thumbnails': {}},
+    'statistics': {'subscriberCount': '1000', 'viewCount': '50000', 'videoCount': '20'},
+    'contentDetails': {'relatedPlaylists': {'uploads': 'UU' + 'a' * 22}},
+}
+
+class FakeHttp:
+    """Stand-in for httplib2.Http that replays scripted (status, headers, body) responses"""
+    
+    timeout = None
+    cache = None
+    
+    def __init__(self, script):
+        self.script = list(script)
+        self.statuses = []
+        self.uris = []
+    
+    def request(self, uri, method='GET', body=None, headers=None, **kwargs):
+        import httplib2
+        
+        self.uris.append(uri)
+        assert self.script, "unexpected extra request"
+        status, response_headers, response_body = self.script.pop(0)
+        self.statuses.append(status)
+        return httplib2.Response({'status': status, **response_headers}), json.dumps(response_body).encode()
+
+def test_handle_lookup():
+    """Test channel lookup by handle with a fake HTTP layer"""
+    print("\n🔍 Testing handle lookup...")
+    import youtube_api
+    
+    http = FakeHttp([(200, {}, {'items': [TEST_CHANNEL]})])
+    with mock.patch.object(youtube_api, 'build_http', return_value=http):
+        channel = youtube_api.YouTubeAPI('test-key').get_channel_info('@TestChannel')
+    assert channel['id'] == TEST_CHANNEL['id'], channel
+    assert len(http.uris) == 1 and 'forHandle=%40TestChannel' in http.uris[0], http.uris
+    print("   ✅ Handle resolved with a single forHandle request")
+    
+    http = FakeHttp([(200, {}, {})] * 3)
+    with mock.patch.object(youtube_api, 'build_http', return_value=http):
+        try:
+            youtube_api.YouTubeAPI('test-key').get_channel_info('@unknown')
+            raise AssertionError("unknown handle was resolved")
+        except ValueError:
+            pass
+    assert len(http.uris) == 3 and not any('/search' in uri for uri in http.uris), http.uris
+    print("   ✅ No search request unless allowed")
+    return True
+
+def test_channel_id_lookup():
+    """Test that a channel ID is looked up by ID alone"""
+    print("\n🔍 Testing channel ID lookup...")
+    import youtube_api
+    
+    http = FakeHttp([(200, {}, {'items': [TEST_CHANNEL]})])
+    with mock.patch.object(youtube_api, 'build_http', return_value=http):
+        channel = youtube_api.YouTubeAPI('test-key').get_channel_info(TEST_CHANNEL['id'])
+    assert channel['id'] == TEST_CHANNEL['id'], channel
+    assert len(http.uris) == 1, http.uris
+    print("   ✅ Channel ID resolved with a single request")
+    
+    unknown_id = 'UC' + 'b' * 22
+    http = FakeHttp([(200, {}, {})])
+    with mock.patch.object(youtube_api, 'build_http', return_value=http):
+        try:
+            youtube_api.YouTubeAPI('test-key').get_channel_info(unknown_id)
+            raise AssertionError("unknown channel ID was resolved")
+        except ValueError:
+            pass
+    assert len(http.uris) == 1 and 'id=' + unknown_id in http.uris[0], http.uris
+    print("   ✅ Unknown channel ID not retried as a username")
+    return True
+
+def test_duration_seconds():
+    """Test ISO 8601 video duration parsing"""
+    print("\n🔍 Testing duration parsing...")
+    from youtube_api import _duration_seconds
+    
+    cases = {
+        'PT0S': 0, 'PT45S': 45, 'PT4M13S': 253, 'PT1H2M3S': 3723,
+        'P1DT2H': 93600, 'P0D': 0, 'PT': 0, '': 0, '1H2M': 0, 'PT1X': 0,
+    }
+    for duration, expected in cases.items():
+        assert _duration_seconds(duration) == expected, (duration, _duration_seconds(duration))
+    print("   ✅ Durations parsed, malformed values map to 0")
+    return True
+
+def _execute_scripted(script):
+    """Run one channels.list request against a scripted FakeHttp, with sleeps recorded"""
+    import youtube_api
+    
+    http = FakeHttp(script)
+    with mock.patch.object(youtube_api, 'build_http', return_value=http), \
+            mock.patch.object(youtube_api.time, 'sleep') as sleep:
+        api = youtube_api.YouTubeAPI('test-key')
+        try:
+            result = api._execute(api.youtube.channels().list(part='id', id='UC1'))
+        except youtube_api.HttpError as e:
+            result = e
+    return result, http.statuses, [call.args[0] for call in sleep.call_args_list]
+
+def test_api_retries():
+    """Test retries with backoff on transient API errors"""
+    print("\n🔍 Testing API retries...")
+    from youtube_api import HttpError
+    from config import API_MAX_RETRIES
+    
+    ok = (200, {}, {'items': [{'id': 'UC1'}]})
+    error = {'error': {'message': 'test'}}
+    
+    # 503 and 429 are retried, Retry-After is honored
+    result, statuses, sleeps = _execute_scripted([(503, {}, error), (429, {'retry-after': '3'}, error), ok])
+    assert result == ok[2], result
+    assert statuses == [503, 429, 200], statuses
+    assert len(sleeps) == 2 and sleeps[1] == 3.0, sleeps
+    print("   ✅ Transient errors retried, Retry-After honored")
+    
+    # Client errors are not retried
+    result, statuses, sleeps = _execute_scripted([(400, {}, error)])
+    assert isinstance(result, HttpError) and statuses == [400] and not sleeps, statuses
+    print("   ✅ Client errors raised without retry")
+    
+    # Retries stop after API_MAX_RETRIES
+    result, statuses, sleeps = _execute_scripted([(500, {}, error)] * (API_MAX_RETRIES + 2))
+    assert isinstance(result, HttpError), result
+    assert len(statuses) == API_MAX_RETRIES + 1 and len(sleeps) == API_MAX_RETRIES, statuses
+    print(f"   ✅ Gave up after {API_MAX_RETRIES} retries")
+    return True
+
 def main():
     """Run all tests"""
     print("🚀 YTGraphX Test Suite")
     print("=" * 50)
     
+    tests = [
+        test_imports,
+        test_youtube_api,
+        test_charts,
+        test_format_numbers,
+        test_downsampling,
+        test_api_cache,
+        test_http_cache,
+        test_handle_lookup,
+        test_channel_id_lookup,
+        test_duration_seconds,
+        test_api_retries,
+    ]
     tests_passed = 0
-    total_tests = 3
-    
-    # Test imports
-    if test_imports():
-        tests_passed += 1
+    total_tests = len(tests)
     
-    # Test YouTube API
-    if test_youtube_api():
-        tests_passed += 1
-    
-    # Test charts
-    if test_charts():
-        tests_passed += 1
+    for test in tests:
+        try:
+            passed = test()
+        except AssertionError as e:
+            print(f"   ❌ Check failed: {e}")
+            passed = False
+        if passed:
+            tests_passed += 1
     
     # Summary
     print("\n" + "=" * 50)
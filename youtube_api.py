@@ -3,16 +3,266 @@ YouTube Data API v3 Integration
 Handles all YouTube API interactions for channel data retrieval
 """
 
+import functools
 import json
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Tuple
+import logging
+import os
 import random
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
+from datetime import date, datetime
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
+from googleapiclient.http import build_http
+from googleapiclient.model import JsonModel
+import httplib2
+import numpy as np
 import pandas as pd
 
-from config import YOUTUBE_API_KEY, YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, HISTORICAL_MONTHS
+try:
+    import orjson
+except ImportError:  # optional, the stdlib json parser is used instead
+    orjson = None
+
+from config import (YOUTUBE_API_KEY, YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, HISTORICAL_MONTHS,
+                    API_CACHE_TTL, API_CACHE_SIZE, HTTP_CACHE_DIR, HTTP_CACHE_MAX_ENTRIES, HTTP_TIMEOUT, HTTP_POOL_SIZE,
+                    API_MAX_RETRIES, API_RETRY_BASE_DELAY, API_RETRY_MAX_DELAY)
+
+
+logger = logging.getLogger(__name__)
+
+# Channel IDs are 'UC' followed by 22 URL-safe base64 characters
+_CHANNEL_ID_RE = re.compile(r'^UC[\w-]{22}$')
+
+# Characters allowed in a YouTube handle
+_HANDLE_RE = re.compile(r'^[A-Za-z0-9_.-]+$')
+
+# Snippet fields shared by channels and videos, fetched in one call
+_SNIPPET_FIELDS = itemgetter('title', 'description', 'publishedAt', 'thumbnails')
+
+# Channel parts fetched by every channel lookup, contentDetails carries the
+# uploads playlist so get_channel_videos needs no channels.list of its own
+_CHANNEL_PARTS = 'snippet,statistics,brandingSettings,contentDetails'
+
+# Maximum maxResults and number of IDs per list request
+_PAGE_SIZE = 50
+
+# HTTP statuses worth retrying: rate limiting and transient server errors
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Response fields used by _format_video_data
+_VIDEO_FIELDS = 'items(id,snippet(title,description,publishedAt,thumbnails),statistics,contentDetails/duration)'
+
+# ISO 8601 video duration, e.g. 'PT1H2M3S' or 'P1DT2H' for very long streams
+_ISO_DURATION_RE = re.compile(r'^P(?:(\d+)D)?(?:T(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?)?$')
+
+# Seconds per day, hour, minute and second, matching the regex groups
+_DURATION_UNITS = (86400, 3600, 60, 1)
+
+
+def _historical_kernel(subscribers: int, views: int, videos: int, random_draws: np.ndarray) -> np.ndarray:
+    """
+    Numeric core of the mock historical data
+    
+    Args:
+        subscribers: Current subscriber count
+        views: Current view count
+        videos: Current video count
+        random_draws: One uniform [0, 1) draw per month, oldest month first
+        
+    Returns:
+        int64 array of shape (3, months) with subscriber, view and video rows
+    """
+    months_back = np.arange(len(random_draws), 0, -1)
+    growth_factor = 1 - months_back * 0.05  # 5% growth per month
+    random_variation = 0.8 + random_draws * 0.4  # ±20% variation
+    current = np.array([subscribers, views, videos], dtype=np.float64)
+    return np.multiply.outer(current, growth_factor * random_variation).astype(np.int64)
+
+
+@dataclass(slots=True, frozen=True)
+class VideoRecord:
+    """Formatted video data as returned by YouTubeAPI.get_channel_videos"""
+    id: str
+    title: str
+    description: str
+    published_at: str
+    thumbnails: Dict
+    statistics: Dict
+    duration: str
+    duration_seconds: int
+    view_count: int
+    like_count: int
+    comment_count: int
+    
+    def as_dict(self) -> Dict:
+        """Plain dictionary copy of the record, e.g. for JSON serialization"""
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+class _OrjsonModel(JsonModel):
+    """JsonModel that parses response bodies with orjson"""
+    
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and 'data' in body:
+            body = body['data']
+        return body
+
+
+class _HttpCache:
+    """
+    On-disk HTTP response cache shared by all connections
+    
+    Provides the get/set/delete interface httplib2 expects of a cache.
+    Unlike httplib2.FileCache, entries are written atomically so pooled
+    connections used from several threads can share one directory, and at
+    most HTTP_CACHE_MAX_ENTRIES entries are kept. The cache is best effort,
+    so I/O errors are ignored.
+    """
+    
+    def __init__(self, directory: str):
+        # The directory is created on first write, not up front
+        self.directory = directory
+        self._count = None  # Entries on disk, counted on the first write
+        self._lock = threading.Lock()
+    
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, httplib2.safename(key))
+    
+    def get(self, key):
+        try:
+            with open(self._path(key), 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+    
+    def set(self, key, value):
+        path = self._path(key)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            is_new = not os.path.exists(path)
+            with open(tmp_path, 'wb') as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        
+        with self._lock:
+            if self._count is None:
+                self._count = len(self._entries())
+            elif is_new:
+                self._count += 1
+            if self._count > HTTP_CACHE_MAX_ENTRIES:
+                self._evict()
+    
+    def delete(self, key):
+        try:
+            os.remove(self._path(key))
+        except OSError:
+            return
+        with self._lock:
+            if self._count:
+                self._count -= 1
+    
+    def _entries(self) -> List[os.DirEntry]:
+        """Cache entries currently on disk"""
+        try:
+            return [entry for entry in os.scandir(self.directory)
+                    if entry.is_file() and not entry.name.endswith('.tmp')]
+        except OSError:
+            return []
+    
+    def _evict(self):
+        """
+        Remove the oldest entries, keeping the newest HTTP_CACHE_MAX_ENTRIES // 2
+        
+        Trimming below the limit means the directory is only scanned again
+        after that many new entries, not on every write.
+        """
+        keep = HTTP_CACHE_MAX_ENTRIES // 2
+        entries = self._entries()
+        try:
+            entries.sort(key=lambda entry: entry.stat().st_mtime)
+        except OSError:
+            pass
+        for entry in entries[:max(len(entries) - keep, 0)]:
+            try:
+                os.remove(entry.path)
+            except OSError:
+                pass
+        self._count = min(len(entries), keep)
+
+
+def _duration_seconds(duration: str) -> int:
+    """
+    Convert an ISO 8601 video duration to seconds
+    
+    Args:
+        duration: Duration string from contentDetails, e.g. 'PT4M13S'
+        
+    Returns:
+        Total length in seconds, 0 if the string is not a valid duration
+    """
+    match = _ISO_DURATION_RE.match(duration)
+    if not match:
+        return 0
+    return sum(int(value) * unit for value, unit in zip(match.groups(), _DURATION_UNITS) if value)
+
+
+@functools.lru_cache(maxsize=1)
+def _dates_for(today: date) -> Tuple[pd.DatetimeIndex, Tuple[str, ...]]:
+    """
+    Dates of the mock historical data points, computed once per day
+    
+    Args:
+        today: Current date
+        
+    Returns:
+        DatetimeIndex named 'date', oldest first, 30 days apart and ending 30
+        days before today, plus the same dates as 'YYYY-MM-DD' strings
+    """
+    months_back = np.arange(HISTORICAL_MONTHS, 0, -1)
+    dates = pd.DatetimeIndex(np.datetime64(today, 'D') - months_back * np.timedelta64(30, 'D'), name='date')
+    return dates, tuple(dates.strftime('%Y-%m-%d'))
+
+
+def _retry_delay(error: Exception, attempt: int) -> float:
+    """
+    Seconds to wait before retrying a failed request
+    
+    Args:
+        error: Exception raised by the failed attempt
+        attempt: Zero-based number of the failed attempt
+        
+    Returns:
+        The server's Retry-After value if it sent one, otherwise an
+        exponential backoff with full jitter, both capped at API_RETRY_MAX_DELAY
+    """
+    retry_after = error.resp.get('retry-after', '') if isinstance(error, HttpError) else ''
+    if retry_after.isdigit():
+        return min(float(retry_after), API_RETRY_MAX_DELAY)
+    return random.uniform(0, min(API_RETRY_BASE_DELAY * 2 ** attempt, API_RETRY_MAX_DELAY))
+
+
+def _identifier_key(channel_identifier: str) -> str:
+    """
+    Normalize a channel identifier so '@Foo', 'Foo' and 'foo' share a cache entry
+    
+    Channel IDs are case-sensitive, so they are kept as they are.
+    """
+    ident = channel_identifier.lstrip('@')
+    return ident if _CHANNEL_ID_RE.match(ident) else ident.lower()
 
 
 class YouTubeAPI:
@@ -21,50 +271,187 @@ class YouTubeAPI:
     def __init__(self, api_key: str):
         """Initialize YouTube API client"""
         self.api_key = api_key
-        self.youtube = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=api_key)
+        # Use the discovery document bundled with googleapiclient instead of
+        # fetching it over the network, and skip the discovery file cache
+        self.youtube = build(YOUTUBE_API_SERVICE_NAME, YOUTUBE_API_VERSION, developerKey=api_key,
+                             static_discovery=True, cache_discovery=False,
+                             model=_OrjsonModel() if orjson else None)
+        self._http_cache = _HttpCache(HTTP_CACHE_DIR) if HTTP_CACHE_DIR else None
+        self._idle_http = []
+        self._http_lock = threading.Lock()
+        self._rng = np.random.default_rng()
+        self._cache = {}
+        self._cache_lock = threading.Lock()
+    
+    def _cached(self, key: Tuple, fetch):
+        """
+        Return a cached API result, fetching it if missing or expired
+        
+        Args:
+            key: Cache key tuple
+            fetch: Callable producing the value on a cache miss
+            
+        Returns:
+            Cached or freshly fetched value
+        """
+        now = time.monotonic()
+        with self._cache_lock:
+            entry = self._cache.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        
+        value = fetch()
+        
+        with self._cache_lock:
+            if key not in self._cache and len(self._cache) >= API_CACHE_SIZE:
+                # Drop expired entries first, then the oldest ones
+                for stale in [k for k, (expires, _) in self._cache.items() if expires <= now]:
+                    del self._cache[stale]
+                while len(self._cache) >= API_CACHE_SIZE:
+                    del self._cache[next(iter(self._cache))]
+            self._cache.pop(key, None)
+            self._cache[key] = (time.monotonic() + API_CACHE_TTL, value)
+        return value
+    
+    def invalidate(self, channel_identifier: str):
+        """
+        Drop the cached results for a channel, so the next call refetches them
+        
+        Args:
+            channel_identifier: Handle, channel ID or username as passed to
+                get_channel_info or get_comprehensive_stats
+        """
+        ident = _identifier_key(channel_identifier)
+        with self._cache_lock:
+            self._cache.pop(('stats', ident), None)
+            info = self._cache.pop(('info', ident), None)
+            if info is not None:
+                channel_id = info[1]['id']
+                for key in [k for k in self._cache if k[0] == 'videos' and k[1] == channel_id]:
+                    del self._cache[key]
+    
+    def _execute(self, request):
+        """
+        Execute an API request on a pooled HTTP connection
+        
+        httplib2.Http objects are not thread-safe, so each request checks one
+        out of the client's pool for its duration, building a new one only
+        if none is idle. Up to HTTP_POOL_SIZE connections are kept alive for
+        later requests from any thread. All of them share one HTTP cache, so
+        responses Google marks as cacheable are revalidated instead of refetched.
+        
+        Rate limiting, transient server errors and dropped connections are
+        retried up to API_MAX_RETRIES times with exponential backoff.
+        
+        Args:
+            request: googleapiclient HttpRequest
+            
+        Returns:
+            Parsed response dictionary
+        """
+        with self._http_lock:
+            http = self._idle_http.pop() if self._idle_http else None
+        if http is None:
+            http = build_http()
+            http.timeout = HTTP_TIMEOUT
+            http.cache = self._http_cache
+        
+        try:
+            for attempt in range(API_MAX_RETRIES + 1):
+                try:
+                    return request.execute(http=http)
+                except (HttpError, ConnectionError, TimeoutError) as e:
+                    if attempt == API_MAX_RETRIES or (isinstance(e, HttpError) and e.resp.status not in _RETRY_STATUSES):
+                        raise
+                    delay = _retry_delay(e, attempt)
+                    # Log the status only, the request URI carries the API key
+                    logger.warning("Retrying %s in %.1fs after %s", request.methodId, delay,
+                                   e.status_code if isinstance(e, HttpError) else type(e).__name__)
+                    time.sleep(delay)
+        finally:
+            with self._http_lock:
+                if len(self._idle_http) < HTTP_POOL_SIZE:
+                    self._idle_http.append(http)
+    
+    def _first_channel(self, request) -> Optional[Dict]:
+        """Execute a channels.list request, returning its first item or None"""
+        try:
+            response = self._execute(request)
+        except Exception:
+            return None
+        return response['items'][0] if response.get('items') else None
+    
+    def _by_id(self, channel_id: str) -> Optional[Dict]:
+        """Raw channel item for a channel ID, or None"""
+        return self._first_channel(self.youtube.channels().list(
+            part=_CHANNEL_PARTS,
+            id=channel_id
+        ))
+    
+    def _by_username(self, username: str) -> Optional[Dict]:
+        """Raw channel item for a legacy username, or None"""
+        return self._first_channel(self.youtube.channels().list(
+            part=_CHANNEL_PARTS,
+            forUsername=username
+        ))
     
-    def get_channel_info(self, channel_identifier: str) -> Dict:
+    def get_channel_info(self, channel_identifier: str, allow_search: bool = False) -> Dict:
         """
-        Get channel information by channel ID or username
+        Get channel information by handle, channel ID or username
+        
+        Results are reused for API_CACHE_TTL seconds.
         
         Args:
-            channel_identifier: Channel ID or username (with or without @)
+            channel_identifier: Handle, channel ID or username (with or without @)
+            allow_search: Fall back to a search by channel name (costs 100
+                quota units instead of 1)
             
         Returns:
             Dictionary containing channel information
         """
+        return self._cached(('info', _identifier_key(channel_identifier)),
+                            lambda: self._fetch_channel_info(channel_identifier, allow_search))
+    
+    def _fetch_channel_info(self, channel_identifier: str, allow_search: bool) -> Dict:
+        """Look up channel information on the API, bypassing the cache"""
         try:
             # Remove @ if present
             if channel_identifier.startswith('@'):
                 channel_identifier = channel_identifier[1:]
             
-            # Try to get channel by ID first
-            try:
-                request = self.youtube.channels().list(
-                    part='snippet,statistics,brandingSettings',
-                    id=channel_identifier
-                )
-                response = request.execute()
-                
-                if 'items' in response and response['items']:
-                    return self._format_channel_data(response['items'][0])
-            except Exception as e:
-                pass
+            # Resolve handles directly, this is the common case for '@name' input
+            if not _CHANNEL_ID_RE.match(channel_identifier) and _HANDLE_RE.match(channel_identifier):
+                item = self._first_channel(self.youtube.channels().list(
+                    part=_CHANNEL_PARTS,
+                    forHandle='@' + channel_identifier
+                ))
+                if item:
+                    return self._format_channel_data(item)
             
-            # If not found by ID, try to get by username
-            try:
-                request = self.youtube.channels().list(
-                    part='snippet,statistics,brandingSettings',
-                    forUsername=channel_identifier
-                )
-                response = request.execute()
-                
-                if 'items' in response and response['items']:
-                    return self._format_channel_data(response['items'][0])
-            except Exception as e:
-                pass
+            if _CHANNEL_ID_RE.match(channel_identifier):
+                # A channel ID is only looked up by ID, one quota unit
+                item = self._by_id(channel_identifier)
+                if item:
+                    return self._format_channel_data(item)
+            else:
+                # Race the ID and username lookups, the first match wins and
+                # the other lookup is not waited for
+                executor = ThreadPoolExecutor(max_workers=2)
+                try:
+                    futures = [executor.submit(self._by_id, channel_identifier),
+                               executor.submit(self._by_username, channel_identifier)]
+                    for future in as_completed(futures):
+                        item = future.result()
+                        if item:
+                            return self._format_channel_data(item)
+                finally:
+                    executor.shutdown(wait=False, cancel_futures=True)
+            
+            # If all lookups failed, optionally search by channel name
+            if not allow_search:
+                raise ValueError(f"Channel '{channel_identifier}' not found. Please check the channel ID or username.")
             
-            # If both methods failed, try searching by channel name
+            logger.warning("Falling back to search.list for '%s' (100 quota units)", channel_identifier)
             try:
                 search_request = self.youtube.search().list(
                     part='snippet',
@@ -72,20 +459,15 @@ class YouTubeAPI:
                     type='channel',
                     maxResults=1
                 )
-                search_response = search_request.execute()
+                search_response = self._execute(search_request)
                 
                 if 'items' in search_response and search_response['items']:
                     channel_id = search_response['items'][0]['id']['channelId']
                     
                     # Get detailed channel info
-                    channel_request = self.youtube.channels().list(
-                        part='snippet,statistics,brandingSettings',
-                        id=channel_id
-                    )
-                    channel_response = channel_request.execute()
-                    
-                    if 'items' in channel_response and channel_response['items']:
-                        return self._format_channel_data(channel_response['items'][0])
+                    item = self._by_id(channel_id)
+                    if item:
+                        return self._format_channel_data(item)
             except Exception as e:
                 pass
             
@@ -101,156 +483,205 @@ class YouTubeAPI:
         except Exception as e:
             raise ValueError(f"Error fetching channel info: {str(e)}")
     
-    def get_channel_videos(self, channel_id: str, max_results: int = 50) -> List[Dict]:
+    def get_channel_videos(self, channel_id: str, max_results: int = 50,
+                           uploads_playlist_id: Optional[str] = None) -> List[VideoRecord]:
         """
         Get recent videos from a channel
         
+        Results are reused for API_CACHE_TTL seconds.
+        
         Args:
             channel_id: YouTube channel ID
             max_results: Maximum number of videos to retrieve
+            uploads_playlist_id: The channel's uploads playlist, as returned by
+                get_channel_info; saves looking it up
             
         Returns:
-            List of video dictionaries
+            List of video records
         """
+        return self._cached(('videos', channel_id, max_results),
+                            lambda: self._fetch_channel_videos(channel_id, max_results, uploads_playlist_id))
+    
+    def _fetch_channel_videos(self, channel_id: str, max_results: int,
+                              uploads_playlist_id: Optional[str]) -> List[VideoRecord]:
+        """Fetch recent videos from the API, bypassing the cache"""
+        if max_results <= 0:
+            return []
+        
         try:
-            # Get uploads playlist ID
-            channel_request = self.youtube.channels().list(
-                part='contentDetails',
-                id=channel_id
-            )
-            channel_response = channel_request.execute()
-            
-            if not channel_response['items']:
-                raise ValueError("Channel not found")
-            
-            uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
-            
-            # Get videos from uploads playlist
-            videos_request = self.youtube.playlistItems().list(
-                part='snippet,contentDetails',
-                playlistId=uploads_playlist_id,
-                maxResults=max_results
-            )
-            videos_response = videos_request.execute()
-            
-            # Get detailed video statistics
-            video_ids = [item['contentDetails']['videoId'] for item in videos_response['items']]
-            
-            if not video_ids:
-                return []
-            
-            # Get video details
-            video_details_request = self.youtube.videos().list(
-                part='snippet,statistics,contentDetails',
-                id=','.join(video_ids)
-            )
-            video_details_response = video_details_request.execute()
+            # Get uploads playlist ID unless the caller already has it
+            if not uploads_playlist_id:
+                channel_request = self.youtube.channels().list(
+                    part='contentDetails',
+                    id=channel_id,
+                    fields='items(contentDetails/relatedPlaylists/uploads)'
+                )
+                channel_response = self._execute(channel_request)
+                
+                if not channel_response.get('items'):
+                    raise ValueError("Channel not found")
+                
+                uploads_playlist_id = channel_response['items'][0]['contentDetails']['relatedPlaylists']['uploads']
             
-            return [self._format_video_data(video) for video in video_details_response['items']]
+            # Page through the uploads playlist. Pages hold at most 50 IDs, one
+            # videos.list request worth, so each page's details are fetched and
+            # formatted in the background while the next page is fetched
+            pages = -(-max_results // _PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=pages) as executor:
+                detail_futures = []
+                fetched = 0
+                page_token = None
+                while fetched < max_results:
+                    videos_request = self.youtube.playlistItems().list(
+                        part='contentDetails',
+                        playlistId=uploads_playlist_id,
+                        maxResults=min(_PAGE_SIZE, max_results - fetched),
+                        pageToken=page_token,
+                        fields='nextPageToken,items(contentDetails/videoId)'
+                    )
+                    videos_response = self._execute(videos_request)
+                    video_ids = [item['contentDetails']['videoId'] for item in videos_response.get('items', [])]
+                    if video_ids:
+                        detail_futures.append(executor.submit(self._fetch_video_details, video_ids))
+                    fetched += len(video_ids)
+                    
+                    page_token = videos_response.get('nextPageToken')
+                    if not page_token:
+                        break
+                
+                return [video for future in detail_futures for video in future.result()]
             
         except HttpError as e:
             raise ValueError(f"Error fetching videos: {e}")
         except Exception as e:
             raise ValueError(f"Error fetching videos: {str(e)}")
     
+    def _fetch_video_details(self, video_ids: List[str]) -> List[VideoRecord]:
+        """Fetch and format the details of up to 50 videos in one request"""
+        response = self._execute(self.youtube.videos().list(
+            part='snippet,statistics,contentDetails',
+            id=','.join(video_ids),
+            fields=_VIDEO_FIELDS
+        ))
+        return [self._format_video_data(video) for video in response.get('items', [])]
+    
     def _format_channel_data(self, channel_data: Dict) -> Dict:
         """Format raw channel data from API"""
+        snippet = channel_data['snippet']
+        statistics = channel_data['statistics']
+        title, description, published_at, thumbnails = _SNIPPET_FIELDS(snippet)
         return {
             'id': channel_data['id'],
-            'title': channel_data['snippet']['title'],
-            'description': channel_data['snippet']['description'],
-            'custom_url': channel_data['snippet'].get('customUrl', ''),
-            'published_at': channel_data['snippet']['publishedAt'],
-            'thumbnails': channel_data['snippet']['thumbnails'],
-            'statistics': channel_data['statistics'],
+            'title': title,
+            'description': description,
+            'custom_url': snippet.get('customUrl', ''),
+            'published_at': published_at,
+            'thumbnails': thumbnails,
+            'statistics': statistics,
             'branding_settings': channel_data.get('brandingSettings', {}),
-            'subscriber_count': int(channel_data['statistics'].get('subscriberCount', 0)),
-            'view_count': int(channel_data['statistics'].get('viewCount', 0)),
-            'video_count': int(channel_data['statistics'].get('videoCount', 0))
+            'uploads_playlist_id': channel_data['contentDetails']['relatedPlaylists']['uploads'],
+            'subscriber_count': int(statistics.get('subscriberCount', 0)),
+            'view_count': int(statistics.get('viewCount', 0)),
+            'video_count': int(statistics.get('videoCount', 0))
         }
     
-    def _format_video_data(self, video_data: Dict) -> Dict:
+    def _format_video_data(self, video_data: Dict) -> VideoRecord:
         """Format raw video data from API"""
-        return {
-            'id': video_data['id'],
-            'title': video_data['snippet']['title'],
-            'description': video_data['snippet']['description'],
-            'published_at': video_data['snippet']['publishedAt'],
-            'thumbnails': video_data['snippet']['thumbnails'],
-            'statistics': video_data['statistics'],
-            'duration': video_data['contentDetails']['duration'],
-            'view_count': int(video_data['statistics'].get('viewCount', 0)),
-            'like_count': int(video_data['statistics'].get('likeCount', 0)),
-            'comment_count': int(video_data['statistics'].get('commentCount', 0))
-        }
+        statistics = video_data['statistics']
+        duration = video_data['contentDetails']['duration']
+        title, description, published_at, thumbnails = _SNIPPET_FIELDS(video_data['snippet'])
+        return VideoRecord(
+            id=video_data['id'],
+            title=title,
+            description=description,
+            published_at=published_at,
+            thumbnails=thumbnails,
+            statistics=statistics,
+            duration=duration,
+            duration_seconds=_duration_seconds(duration),
+            view_count=int(statistics.get('viewCount', 0)),
+            like_count=int(statistics.get('likeCount', 0)),
+            comment_count=int(statistics.get('commentCount', 0))
+        )
     
-    def generate_historical_data(self, channel_data: Dict) -> Dict[str, List[Dict]]:
+    def generate_historical_data_df(self, channel_data: Dict, seed: Optional[int] = None) -> Dict[str, pd.DataFrame]:
         """
         Generate mock historical data for demonstration purposes
         
         Args:
             channel_data: Channel information dictionary
+            seed: Seed for reproducible data, by default the client's random
+                generator is used
             
         Returns:
-            Dictionary containing historical data for subscribers, views, and videos
+            Dictionary of DataFrames for subscribers, views, and videos, each
+            indexed by date with a single int64 metric column
         """
-        current_subscribers = channel_data['subscriber_count']
-        current_views = channel_data['view_count']
-        current_videos = channel_data['video_count']
+        dates, _ = _dates_for(datetime.now().date())
+        rng = self._rng if seed is None else np.random.default_rng(seed)
         
-        subscriber_history = []
-        view_history = []
-        video_history = []
+        subscribers, views, videos = _historical_kernel(
+            channel_data['subscriber_count'],
+            channel_data['view_count'],
+            channel_data['video_count'],
+            rng.random(HISTORICAL_MONTHS)
+        )
         
-        # Generate historical data for the specified number of months
-        for i in range(HISTORICAL_MONTHS, 0, -1):
-            date = datetime.now() - timedelta(days=30 * i)
-            date_str = date.strftime('%Y-%m-%d')
-            
-            # Simulate growth patterns with some randomness
-            growth_factor = 1 - (i * 0.05)  # 5% growth per month
-            random_variation = 0.8 + random.random() * 0.4  # ±20% variation
-            
-            subscriber_history.append({
-                'date': date_str,
-                'subscribers': int(current_subscribers * growth_factor * random_variation)
-            })
-            
-            view_history.append({
-                'date': date_str,
-                'views': int(current_views * growth_factor * random_variation)
-            })
-            
-            video_history.append({
-                'date': date_str,
-                'videos': int(current_videos * growth_factor * random_variation)
-            })
+        return {
+            'subscriber_history': pd.DataFrame({'subscribers': subscribers}, index=dates),
+            'view_history': pd.DataFrame({'views': views}, index=dates),
+            'video_history': pd.DataFrame({'videos': videos}, index=dates)
+        }
+    
+    def generate_historical_data(self, channel_data: Dict, seed: Optional[int] = None) -> Dict[str, List[Dict]]:
+        """
+        Generate mock historical data as lists of data points
         
+        Args:
+            channel_data: Channel information dictionary
+            seed: Seed for reproducible data, by default the client's random
+                generator is used
+            
+        Returns:
+            Dictionary containing historical data for subscribers, views, and videos
+        """
+        _, date_strings = _dates_for(datetime.now().date())
         return {
-            'subscriber_history': subscriber_history,
-            'view_history': view_history,
-            'video_history': video_history
+            key: [{'date': date_string, col: value}
+                  for date_string, value in zip(date_strings, df[col].tolist())]
+            for key, df in self.generate_historical_data_df(channel_data, seed).items()
+            for col in df.columns
         }
     
     def get_comprehensive_stats(self, channel_identifier: str) -> Dict:
         """
         Get comprehensive channel statistics including historical data
         
+        Results are reused for API_CACHE_TTL seconds.
+        
         Args:
             channel_identifier: Channel ID or username
             
         Returns:
             Dictionary containing all channel statistics and historical data
+            (histories as date-indexed DataFrames)
         """
+        return self._cached(('stats', _identifier_key(channel_identifier)),
+                            lambda: self._fetch_comprehensive_stats(channel_identifier))
+    
+    def _fetch_comprehensive_stats(self, channel_identifier: str) -> Dict:
+        """Collect comprehensive channel statistics, bypassing the cache"""
         try:
             # Get channel information
             channel_data = self.get_channel_info(channel_identifier)
             
-            # Get recent videos
-            videos = self.get_channel_videos(channel_data['id'])
-            
-            # Generate historical data
-            historical_data = self.generate_historical_data(channel_data)
+            # Fetch the recent videos in the background while the
+            # historical data is generated
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                videos_future = executor.submit(self.get_channel_videos, channel_data['id'],
+                                                uploads_playlist_id=channel_data['uploads_playlist_id'])
+                historical_data = self.generate_historical_data_df(channel_data)
+                videos = videos_future.result()
             
             return {
                 'channel': channel_data,
@@ -262,5 +693,18 @@ class YouTubeAPI:
             raise ValueError(f"Error getting comprehensive stats: {str(e)}")
 
 
-# Create global instance
-youtube_api = YouTubeAPI(YOUTUBE_API_KEY)
+# Global instance, created on first access so importing this module stays cheap
+_client: Optional[YouTubeAPI] = None
+_client_lock = threading.Lock()
+
+
+def __getattr__(name: str):
+    """Module attribute hook (PEP 562) that builds the global client lazily"""
+    global _client
+    if name != 'youtube_api':
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = YouTubeAPI(YOUTUBE_API_KEY)
+    return _client